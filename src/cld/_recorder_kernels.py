@@ -0,0 +1,113 @@
+"""Audio kernels for the AudioRecorder visualization path.
+
+Uses Numba JIT-compiled loops when numba is installed, otherwise falls back
+to equivalent NumPy expressions. RMS prefers the numpy-rms SIMD extension.
+Both numba and numpy-rms are optional dependencies.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+
+import numpy as np
+
+_logger = logging.getLogger(__name__)
+
+NUMBA_AVAILABLE = False
+_NUMBA_IMPORT_ERROR: Exception | None = None
+try:
+    import numba as _nb
+    NUMBA_AVAILABLE = True
+except Exception as exc:
+    _nb = None
+    _NUMBA_IMPORT_ERROR = exc
+
+try:
+    import numpy_rms as _numpy_rms
+except ImportError:
+    _numpy_rms = None
+
+
+if NUMBA_AVAILABLE:
+
+    # Serial kernels: they run on the recorder's visualization worker thread
+    # over one ~1k-sample block at a time, ~30 times a second, so spinning up
+    # numba's thread pool would cost more than it saves and compete with the
+    # audio callback and whisper.cpp for cores
+    @_nb.njit(cache=True, fastmath=True)
+    def _mean_square_nb(src):
+        s = 0.0
+        for i in range(src.shape[0]):
+            v = np.float64(src[i])
+            s += v * v
+        return s / src.shape[0]
+
+    @_nb.njit(cache=True, fastmath=True)
+    def _band_means_nb(spectrum, band_lo, band_hi, inv_widths, out):
+        for b in range(out.shape[0]):
+            s = 0.0
+            for k in range(band_lo[b], band_hi[b]):
+                c = spectrum[k]
+                s += math.sqrt(c.real * c.real + c.imag * c.imag)
+            out[b] = s * inv_widths[b]
+
+
+def mean_square(src: np.ndarray) -> float:
+    """Mean of the squared samples of an array (0.0 for empty input)."""
+    if src.size == 0:
+        return 0.0
+    if _numpy_rms is not None and src.dtype == np.float32:
+        # SIMD square-and-accumulate over the whole array as one window
+        value = float(_numpy_rms.rms(np.ravel(src), window_size=src.size)[0])
+        return value * value
+    flat = np.ravel(src)
+    if NUMBA_AVAILABLE:
+        return float(_mean_square_nb(flat))
+    if flat.dtype.kind == "f":
+        # One pass without a squared temporary (integer dot would overflow)
+        return float(np.dot(flat, flat)) / flat.size
+    return float(np.mean(np.square(flat, dtype=np.float64)))
+
+
+def rms(src: np.ndarray) -> float:
+    """Root-mean-square of an array (0.0 for empty input)."""
+    return math.sqrt(mean_square(src))
+
+
+def band_means(
+    spectrum: np.ndarray,
+    band_lo: np.ndarray,
+    band_hi: np.ndarray,
+    inv_widths: np.ndarray,
+    out: np.ndarray,
+) -> None:
+    """Average |spectrum| over each [band_lo, band_hi) range into out.
+
+    Fuses the magnitude and band reduction into one pass over the complex
+    bins. Numba only; callers check NUMBA_AVAILABLE and use NumPy otherwise.
+    """
+    _band_means_nb(spectrum, band_lo, band_hi, inv_widths, out)
+
+
+def warmup() -> None:
+    """Compile the JIT kernels before the first audio callback.
+
+    No-op without numba. With numba, the first call per signature compiles
+    (or loads from the on-disk cache), which would stall the visualization
+    worker's first updates (and hold the GIL the audio callback needs), so
+    this is run when the stream is opened.
+    """
+    if not NUMBA_AVAILABLE:
+        return
+    try:
+        samples = np.zeros(16, dtype=np.float32)
+        mean_square(samples)
+        lo = np.zeros(1, dtype=np.intp)
+        hi = np.ones(1, dtype=np.intp)
+        widths = np.ones(1, dtype=np.float32)
+        out = np.empty(1, dtype=np.float32)
+        for dtype in (np.complex64, np.complex128):
+            band_means(np.zeros(9, dtype=dtype), lo, hi, widths, out)
+    except Exception:
+        _logger.debug("Numba kernel warmup failed", exc_info=True)
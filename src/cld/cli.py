@@ -167,6 +167,11 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Show console window for debugging (Windows).",
     )
+    parser.add_argument(
+        "--refresh-hardware",
+        action="store_true",
+        help="Re-detect hardware instead of using the cached result.",
+    )
     parser.add_argument(
         "command",
         nargs="?",
@@ -183,11 +188,21 @@ def build_parser() -> argparse.ArgumentParser:
 
 
 def main(argv: Sequence[str] | None = None) -> int:
+    if getattr(sys, "frozen", False):
+        # Worker processes (parallel model verification) re-enter the frozen
+        # executable; let them run their task instead of the app
+        import multiprocessing
+        multiprocessing.freeze_support()
+
     parser = build_parser()
     args = parser.parse_args(argv)
 
     # Console already set up early by _early_debug_check() if --debug was passed
 
+    if args.refresh_hardware:
+        # Inherited by the background daemon process as well
+        os.environ["CLD_REFRESH_HW"] = "1"
+
     if args.version:
         print(__version__)
         return 0
@@ -33,6 +33,8 @@ class EngineConfig:
     force_cpu: bool = False  # Force CPU-only mode (ignore GPU)
     gpu_device: int = -1  # -1=auto-select, 0=first GPU, 1=second GPU, etc.
     translate_to_english: bool = False  # Translate non-English speech to English
+    lock_model_in_ram: bool = False  # Pin loaded model pages in RAM (may need privileges)
+    quantization: str = "auto"  # "auto", a GGML quant ("q5_0", "q8_0"), or "" for model as-is
 
 
 @dataclass
@@ -230,6 +232,8 @@ class Config:
                 force_cpu=force_cpu,
                 gpu_device=eng.get("gpu_device", config.engine.gpu_device),
                 translate_to_english=eng.get("translate_to_english", config.engine.translate_to_english),
+                lock_model_in_ram=eng.get("lock_model_in_ram", config.engine.lock_model_in_ram),
+                quantization=eng.get("quantization", config.engine.quantization),
             )
 
         # Load output settings
@@ -37,6 +37,7 @@ except ImportError:
 try:
     from cld.ui.settings_popup import SettingsPopup
     from cld.ui.settings_dialog import SettingsDialog
+    from cld.ui.hardware import start_background_detect
     _SETTINGS_AVAILABLE = True
 except ImportError:
     _SETTINGS_AVAILABLE = False
@@ -729,6 +730,11 @@ class STTDaemon:
 
         print("Model loaded. Ready for voice input.", flush=True)
 
+        # Warm the hardware info used by the settings dialog off the main thread
+        # (after the model load, so the backend probe does not race its init)
+        if _SETTINGS_AVAILABLE:
+            start_background_detect()
+
         # Prime the audio recorder for low-latency recording
         # This starts the pre-roll buffer to capture audio before hotkey press
         if self._recorder:
@@ -25,5 +25,7 @@ def build_engine(config: Config) -> STTEngine:
             use_gpu=use_gpu,
             gpu_device=gpu_device,
             translate_to_english=config.engine.translate_to_english,
+            lock_model_in_ram=config.engine.lock_model_in_ram,
+            quantization=config.engine.quantization or None,
         )
     raise EngineError(f"Unknown engine '{engine_type}'")
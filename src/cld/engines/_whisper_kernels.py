@@ -0,0 +1,82 @@
+"""Audio kernels for WhisperEngine hot paths.
+
+Uses Numba JIT-compiled loops when numba is installed, otherwise falls back
+to equivalent NumPy expressions. Numba is an optional dependency.
+"""
+
+from __future__ import annotations
+
+import logging
+
+import numpy as np
+
+_logger = logging.getLogger(__name__)
+
+NUMBA_AVAILABLE = False
+_NUMBA_IMPORT_ERROR: Exception | None = None
+try:
+    import numba as _nb
+    NUMBA_AVAILABLE = True
+except Exception as exc:
+    _nb = None
+    _NUMBA_IMPORT_ERROR = exc
+
+
+if NUMBA_AVAILABLE:
+
+    @_nb.njit(parallel=True, cache=True, fastmath=True)
+    def _to_float32_nb(src, dst, scale):
+        for i in _nb.prange(src.shape[0]):
+            dst[i] = src[i] * scale
+
+    @_nb.njit(parallel=True, cache=True, fastmath=True)
+    def _sum_squares_nb(src):
+        s = 0.0
+        for i in _nb.prange(src.shape[0]):
+            v = np.float64(src[i])
+            s += v * v
+        return s
+
+
+def to_float32(src: np.ndarray, dst: np.ndarray, scale: float = 1.0) -> None:
+    """Convert src into the float32 buffer dst in a single pass.
+
+    Args:
+        src: 1-D input samples (any numeric dtype).
+        dst: float32 output buffer, same length as src.
+        scale: Multiplier applied during conversion (1.0 = plain cast).
+    """
+    if NUMBA_AVAILABLE and src.ndim == 1:
+        _to_float32_nb(src, dst, np.float32(scale))
+    elif scale == 1.0:
+        np.copyto(dst, src, casting="unsafe")
+    else:
+        np.multiply(src, np.float32(scale), out=dst, casting="unsafe")
+
+
+def rms(src: np.ndarray) -> float:
+    """Root-mean-square of a 1-D sample array (0.0 for empty input)."""
+    n = src.size
+    if n == 0:
+        return 0.0
+    if NUMBA_AVAILABLE and src.ndim == 1:
+        return float(np.sqrt(_sum_squares_nb(src) / n))
+    return float(np.sqrt(np.dot(src, src) / n))
+
+
+def warmup() -> None:
+    """Compile the JIT kernels ahead of the first transcription.
+
+    No-op without numba. With numba, the first call per signature compiles
+    (or loads from the on-disk cache), so this is run at model load time.
+    """
+    if not NUMBA_AVAILABLE:
+        return
+    try:
+        buf = np.zeros(16, dtype=np.float32)
+        for dtype in (np.float32, np.int16):
+            src = np.zeros(16, dtype=dtype)
+            to_float32(src, buf)
+            rms(src)
+    except Exception:
+        _logger.debug("Numba kernel warmup failed", exc_info=True)
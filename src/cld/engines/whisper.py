@@ -2,15 +2,23 @@
 
 from __future__ import annotations
 
+import functools
+import json
 import logging
 import os
+import sys
 import threading
+import time
+from contextlib import contextmanager
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 import numpy as np
 
+from cld.engines import _whisper_kernels
+from cld.model_manager import ensure_model, get_models_dir
+
 _whisper_available = False
 _Model = None
 _import_error = None
@@ -18,10 +26,21 @@ _cuda_supported = False
 _vulkan_supported = False
 _system_info = ""
 _has_gpu_init_params = False  # Whether whisper_init_from_file_with_params exists
+_model_init_params: frozenset = frozenset()  # Explicit keyword params of Model.__init__
+_transcribe_param_names: frozenset = frozenset()  # whisper_full_params fields settable per call
 
 try:
     from pywhispercpp.model import Model as _Model
     _whisper_available = True
+    # Probe binding capabilities once so optional kwargs are only passed when accepted
+    # (unknown **params are setattr'd on whisper_full_params and raise)
+    try:
+        import inspect
+        _model_init_params = frozenset(inspect.signature(_Model.__init__).parameters)
+        from pywhispercpp.constants import PARAMS_SCHEMA as _PARAMS_SCHEMA
+        _transcribe_param_names = frozenset(_PARAMS_SCHEMA)
+    except Exception:
+        pass
     # Check GPU backends via system info and DLL presence
     # Vulkan is preferred (universal), CUDA is NVIDIA-only fallback
     try:
@@ -48,13 +67,10 @@ try:
 except Exception as e:
     _import_error = f"{type(e).__name__}: {e}"
 
-
-def get_models_dir() -> Path:
-    """Get CLD models directory."""
-    local_app_data = os.environ.get("LOCALAPPDATA")
-    if local_app_data:
-        return Path(local_app_data) / "CLD" / "models"
-    return Path.home() / ".cld" / "models"
+# Backend probe results are fixed for the process; resolve the name once
+_gpu_backend: Optional[str] = (
+    "Vulkan" if _vulkan_supported else "CUDA" if _cuda_supported else None
+)
 
 
 def is_cuda_supported() -> bool:
@@ -69,7 +85,7 @@ def is_vulkan_supported() -> bool:
 
 def is_gpu_supported() -> bool:
     """Check if any GPU backend is available (Vulkan or CUDA)."""
-    return _vulkan_supported or _cuda_supported
+    return _gpu_backend is not None
 
 
 def get_gpu_backend() -> Optional[str]:
@@ -78,11 +94,7 @@ def get_gpu_backend() -> Optional[str]:
     Returns:
         "Vulkan" (preferred, universal), "CUDA" (NVIDIA-only), or None if CPU-only.
     """
-    if _vulkan_supported:
-        return "Vulkan"
-    if _cuda_supported:
-        return "CUDA"
-    return None
+    return _gpu_backend
 
 
 def get_system_info() -> str:
@@ -100,9 +112,230 @@ def has_gpu_device_selection() -> bool:
     return _has_gpu_init_params
 
 
+# Quantization suffixes of GGML model files (ggml-<model>-<quant>.bin)
+_QUANT_SUFFIXES = ("q4_0", "q4_1", "q5_0", "q5_1", "q8_0")
+
+
+def _split_quantization(model_name: str) -> tuple[str, Optional[str]]:
+    """Split "medium-q5_0" into ("medium", "q5_0"); unquantized names get None."""
+    base, sep, quant = model_name.rpartition("-")
+    if sep and quant in _QUANT_SUFFIXES:
+        return base, quant
+    return model_name, None
+
+
+def _system_info_flag(feature: str) -> bool:
+    """Check a "FEATURE = 1" entry in whisper_print_system_info() output."""
+    return f"{feature} = 1" in _system_info
+
+
+# whisper_print_system_info() features with fast int8 dot products
+_INT8_DOT_FLAGS = ("AVX_VNNI", "AVX512_VNNI", "AMX_INT8")
+
+
+@functools.lru_cache(maxsize=2)
+def _select_quantization(use_gpu: bool) -> str:
+    """Pick the GGML quantization level for this machine (cached per process).
+
+    - GPU: q5_0, smallest VRAM footprint at near-q8 accuracy
+    - x86 CPU with VNNI/AMX int8 dot products and 4GB+ RAM: q8_0, whose
+      int8 matmuls map straight onto those instructions
+    - otherwise (ARM NEON, older x86): q5_0, less memory traffic wins
+    """
+    if use_gpu:
+        return "q5_0"
+    if any(_system_info_flag(flag) for flag in _INT8_DOT_FLAGS):
+        try:
+            import psutil
+            if psutil.virtual_memory().total < 4 * 1024**3:
+                return "q5_0"
+        except Exception:
+            pass
+        return "q8_0"
+    return "q5_0"
+
+
+def _parse_cpu_list(text: str) -> List[int]:
+    """Parse a Linux CPU list like "0-7,16-23"."""
+    cpus: List[int] = []
+    for part in text.strip().split(","):
+        if not part:
+            continue
+        lo, _, hi = part.partition("-")
+        cpus.extend(range(int(lo), int(hi or lo) + 1))
+    return cpus
+
+
+@functools.lru_cache(maxsize=1)
+def _performance_cores() -> Optional[tuple[tuple[int, ...], int]]:
+    """Detect the P-cores of a hybrid (P-core/E-core) CPU.
+
+    - Windows: GetLogicalProcessorInformationEx, highest EfficiencyClass
+      (processor group 0 only)
+    - Linux: /sys/devices/cpu_core/cpus (Intel hybrid PMU)
+
+    Returns:
+        (logical CPU ids, physical P-core count), or None if the CPU is not
+        hybrid or detection failed.
+    """
+    try:
+        if sys.platform == "win32":
+            import ctypes
+            from ctypes import wintypes
+            kernel32 = ctypes.windll.kernel32
+            RelationProcessorCore = 0
+            length = wintypes.DWORD(0)
+            kernel32.GetLogicalProcessorInformationEx(
+                RelationProcessorCore, None, ctypes.byref(length)
+            )
+            buf = ctypes.create_string_buffer(length.value)
+            if not kernel32.GetLogicalProcessorInformationEx(
+                RelationProcessorCore, buf, ctypes.byref(length)
+            ):
+                return None
+            # SYSTEM_LOGICAL_PROCESSOR_INFORMATION_EX: Relationship, Size (DWORDs),
+            # then PROCESSOR_RELATIONSHIP: Flags, EfficiencyClass, Reserved[20],
+            # GroupCount, GroupMask[0] {KAFFINITY Mask, WORD Group} at offset 32
+            cores = []
+            raw = buf.raw
+            offset = 0
+            while offset < length.value:
+                size = int.from_bytes(raw[offset + 4:offset + 8], "little")
+                efficiency = raw[offset + 9]
+                mask = int.from_bytes(raw[offset + 32:offset + 40], "little")
+                group = int.from_bytes(raw[offset + 40:offset + 42], "little")
+                if group == 0:
+                    cores.append((efficiency, [i for i in range(64) if mask >> i & 1]))
+                offset += size
+            top = max((eff for eff, _ in cores), default=0)
+            if top == 0:
+                return None
+            p_cores = [cpus for eff, cpus in cores if eff == top]
+            return tuple(sorted(c for cpus in p_cores for c in cpus)), len(p_cores)
+
+        p_path = Path("/sys/devices/cpu_core/cpus")
+        if not p_path.exists():
+            return None
+        cpus = _parse_cpu_list(p_path.read_text())
+        siblings = set()
+        for cpu in cpus:
+            topo = Path(f"/sys/devices/system/cpu/cpu{cpu}/topology/thread_siblings_list")
+            siblings.add(topo.read_text().strip() if topo.exists() else str(cpu))
+        return tuple(cpus), len(siblings)
+    except Exception:
+        return None
+
+
+# First-run GPU-vs-CPU benchmark results, keyed by model/backend/device
+BACKEND_CACHE_FILE = "backend.json"
+
+
+# GIL switch interval used while the native transcribe call runs (default is 5ms)
+_TRANSCRIBE_SWITCH_INTERVAL = 0.05
+_switch_interval_lock = threading.Lock()
+_switch_interval_users = 0
+_saved_switch_interval = 0.0
+
+
+@contextmanager
+def _coarse_switch_interval() -> Iterator[None]:
+    """Raise sys.setswitchinterval while whisper.cpp runs, restoring it afterwards.
+
+    The interval is process-wide, so overlapping callers are reference counted:
+    the first one in saves the current value and the last one out restores it.
+    """
+    global _switch_interval_users, _saved_switch_interval
+    with _switch_interval_lock:
+        if _switch_interval_users == 0:
+            _saved_switch_interval = sys.getswitchinterval()
+            sys.setswitchinterval(_TRANSCRIBE_SWITCH_INTERVAL)
+        _switch_interval_users += 1
+    try:
+        yield
+    finally:
+        with _switch_interval_lock:
+            _switch_interval_users -= 1
+            if _switch_interval_users == 0:
+                sys.setswitchinterval(_saved_switch_interval)
+
+
+# Whisper encoder context: 1500 positions cover the 30-second window (50 per second)
+_WHISPER_MAX_AUDIO_CTX = 1500
+_AUDIO_CTX_PER_SECOND = 50
+
 # Audio chunking constants for long recordings
 CHUNK_DURATION_SECONDS = 60  # Transcribe in 60-second chunks
 CHUNK_OVERLAP_SECONDS = 5    # 5-second overlap to preserve context at boundaries
+CHUNK_MIN_TAIL_SECONDS = 10  # Tails shorter than this are merged into the previous chunk
+
+# Precomputed sample counts for the common 16kHz case
+_SR_DEFAULT = 16000
+_CHUNK_SAMPLES = CHUNK_DURATION_SECONDS * _SR_DEFAULT
+_OVERLAP_SAMPLES = CHUNK_OVERLAP_SECONDS * _SR_DEFAULT
+_STEP_SAMPLES = _CHUNK_SAMPLES - _OVERLAP_SAMPLES
+_MIN_TAIL_SAMPLES = CHUNK_MIN_TAIL_SECONDS * _SR_DEFAULT
+# Full-scale factors for signed integer PCM input
+_PCM_SCALE = {
+    np.dtype(np.int8): 1.0 / 128.0,
+    np.dtype(np.int16): 1.0 / 32768.0,
+    np.dtype(np.int32): 1.0 / 2147483648.0,
+}
+# Minimum audio per processor for whisper_full_parallel (one full 30s window)
+_PARALLEL_MIN_SAMPLES = 30 * _SR_DEFAULT
+
+
+# Device-visibility variables honoured by ggml's GPU backends
+_GPU_VISIBLE_DEVICES_ENV = {
+    "Vulkan": "GGML_VK_VISIBLE_DEVICES",
+    "CUDA": "CUDA_VISIBLE_DEVICES",
+}
+
+
+def _new_model(path_str: str, use_gpu: bool, gpu_device: int, n_threads: int) -> object:
+    """Construct a pywhispercpp Model with the kwargs this binding supports."""
+    # GPU backend is used automatically when available
+    # Vulkan: universal (NVIDIA/AMD/Intel), CUDA: NVIDIA-only fallback
+    # gpu_device: -1 = auto, 0 = first GPU (usually discrete), 1 = second GPU
+    model_kwargs = {"n_threads": n_threads}
+    if "use_gpu" in _model_init_params:
+        model_kwargs["use_gpu"] = use_gpu
+    if "gpu_device" in _model_init_params:
+        model_kwargs["gpu_device"] = gpu_device
+    elif use_gpu and gpu_device >= 0 and _gpu_backend:
+        # Binding can't select a device; restrict the backend's device list
+        # instead (read when ggml initializes the backend, i.e. the first load).
+        # A value already in the environment wins.
+        env_var = _GPU_VISIBLE_DEVICES_ENV[_gpu_backend]
+        os.environ.setdefault(env_var, str(gpu_device))
+        logging.getLogger(__name__).debug("%s=%s", env_var, os.environ[env_var])
+    # Fused attention kernels (less KV-cache memory and traffic). flash_attn is
+    # a context param, so only bindings that declare it can take it; unknown
+    # kwargs are set on whisper_full_params and raise. Others keep
+    # whisper.cpp's default (already enabled in current releases).
+    if "flash_attn" in _model_init_params:
+        model_kwargs["flash_attn"] = True
+    return _Model(path_str, **model_kwargs)
+
+
+_shared_model_lock = threading.Lock()
+# Models already loaded by the backend benchmark, keyed like _load_shared_model,
+# for it to adopt instead of loading the file again (guarded by _shared_model_lock)
+_adoptable_models: dict[tuple[str, bool, int, int], object] = {}
+
+
+@functools.lru_cache(maxsize=2)
+def _load_shared_model(
+    path_str: str, use_gpu: bool, gpu_device: int, n_threads: int
+) -> tuple[object, threading.Lock]:
+    """Load a Model shared by all WhisperEngine instances with the same settings.
+
+    Returns the model with the lock that serializes transcriptions on it.
+    Call under _shared_model_lock so concurrent engines load it only once.
+    """
+    model = _adoptable_models.pop((path_str, use_gpu, gpu_device, n_threads), None)
+    if model is None:
+        model = _new_model(path_str, use_gpu, gpu_device, n_threads)
+    return model, threading.Lock()
 
 
 class WhisperEngine:
@@ -128,23 +361,52 @@ class WhisperEngine:
         gpu_device: int = -1,
         transcription_timeout: int = 120,
         translate_to_english: bool = False,
+        silence_dbfs_threshold: Optional[float] = -50.0,
+        dynamic_audio_ctx: bool = False,
+        lock_model_in_ram: bool = False,
+        quantization: Optional[str] = "auto",
+        benchmark_backend: bool = True,
     ):
         self.model_name = model_name
-        # Use all cores except core 0 (leaves core 0 for system responsiveness)
+        # "auto" re-picks the quant level of an already-quantized model_name,
+        # "q5_0"/"q8_0"/... forces one, None uses model_name as-is. A different
+        # level is only used when its ggml-<model>-<quant>.bin is on disk.
+        self.quantization = quantization
         cpu_count = os.cpu_count() or 8
-        self.n_threads = n_threads or max(4, cpu_count - 2)
+        if n_threads:
+            self.n_threads = n_threads
+            threads_source = "explicit"
+        else:
+            self.n_threads, threads_source = self._default_n_threads(cpu_count)
         self.gpu_device = gpu_device
         self._cpu_count = cpu_count
+        self._affinity_cpus: Optional[List[int]] = None
         self.transcription_timeout = transcription_timeout
         self.translate_to_english = translate_to_english
+        # Chunks of long recordings below this RMS level are not sent to whisper
+        # (None disables the check)
+        self.silence_dbfs_threshold = silence_dbfs_threshold
+        self._silence_rms = (
+            10.0 ** (silence_dbfs_threshold / 20.0) if silence_dbfs_threshold is not None else 0.0
+        )
+        # Shrink the encoder context to the clip length for short clips.
+        # Faster encoding, but can reduce accuracy, so it is opt-in.
+        self.dynamic_audio_ctx = dynamic_audio_ctx and "audio_ctx" in _transcribe_param_names
+        # Keep model pages resident between dictations (opt-in: needs
+        # RLIMIT_MEMLOCK headroom on POSIX, pins working set on Windows)
+        self.lock_model_in_ram = lock_model_in_ram
         self._model: Optional[object] = None
         self._model_lock = threading.Lock()
+        # Serializes calls into the (possibly shared) whisper context
+        self._transcribe_lock = threading.Lock()
         self._logger = logging.getLogger(__name__)
         self._last_error: Optional[str] = None
+        # Reusable float32 conversion buffer (grown on demand, never shrunk)
+        self._fp32_scratch: Optional[np.ndarray] = None
 
         # GPU support: auto-detect or use explicit setting
         # Vulkan is preferred (universal), CUDA is fallback (NVIDIA-only)
-        gpu_available = is_gpu_supported()
+        gpu_available = _gpu_backend is not None
         if use_gpu is None:
             self.use_gpu = gpu_available
         elif use_gpu and not gpu_available:
@@ -153,18 +415,59 @@ class WhisperEngine:
         else:
             self.use_gpu = use_gpu
 
+        # whisper_full_parallel splits long clips across processors, each using
+        # n_threads / n_processors threads. CPU only (checked per call, since the
+        # backend benchmark can switch use_gpu at load time).
+        self._n_processors = max(1, cpu_count // 8)
+
+        # With auto-detected GPU, time GPU vs CPU once on first load and cache
+        # the winner (integrated GPUs can be slower than a fast CPU). Needs the
+        # use_gpu init param to actually force CPU.
+        self._benchmark_backend = (
+            benchmark_backend and use_gpu is None and self.use_gpu
+            and "use_gpu" in _model_init_params
+        )
+
         # Warn if GPU requested but device selection not available
-        if self.use_gpu and not has_gpu_device_selection():
+        if self.use_gpu and not _has_gpu_init_params:
             self._logger.warning(
                 "GPU requested but whisper_init_from_file_with_params not found. "
                 "GPU device selection (use_gpu/gpu_device params) will be ignored. "
                 "Rebuild pywhispercpp with GPU support to enable this feature."
             )
 
-        backend = get_gpu_backend() or "CPU"
+        backend = _gpu_backend or "CPU"
         self._logger.info("WhisperEngine: model=%s, threads=%d, backend=%s (use_gpu=%s, gpu_device=%d)",
                          model_name, self.n_threads, backend, self.use_gpu, self.gpu_device)
         self._logger.info("System info: %s", _system_info if _system_info else "(not available)")
+        self._logger.debug("n_threads=%d (%s)", self.n_threads, threads_source)
+
+    @staticmethod
+    def _default_n_threads(cpu_count: int) -> tuple[int, str]:
+        """Pick the default whisper.cpp thread count.
+
+        Uses physical cores minus one (left for the system): SMT siblings share
+        one core's SIMD units, so whisper.cpp gains nothing from them. On hybrid
+        CPUs, uses the physical P-core count. Falls back to logical cores minus
+        two when psutil can't report physical cores.
+
+        Returns:
+            Tuple of (n_threads, source description for logging).
+        """
+        p_cores = _performance_cores()
+        if p_cores and p_cores[1] > 1:
+            # Hybrid CPU: E-cores stall whisper.cpp's per-layer thread barriers,
+            # so use only the P-cores (transcription is pinned to them)
+            return p_cores[1], "performance cores"
+        try:
+            import psutil
+            physical = psutil.cpu_count(logical=False)
+            if physical and physical > 1:
+                return physical - 1, "physical cores - 1"
+        except Exception:
+            pass
+        # Use all cores except core 0 (leaves core 0 for system responsiveness)
+        return max(4, cpu_count - 2), "logical cores - 2"
 
     def is_available(self) -> bool:
         return _whisper_available
@@ -173,37 +476,209 @@ class WhisperEngine:
         """Get the last error message."""
         return self._last_error
 
-    def _set_cpu_affinity_exclude_core0(self) -> None:
-        """Set CPU affinity to all cores except core 0 for system responsiveness.
+    def _set_transcription_affinity(self) -> None:
+        """Restrict the process to the CPUs whisper.cpp should run on.
 
-        On systems with SMT/HyperThreading, core 0 has logical processors 0 and 1.
-        We exclude both to leave the first physical core free.
+        On hybrid CPUs this is the P-cores. Otherwise it is all cores except
+        core 0, for system responsiveness: on systems with SMT/HyperThreading,
+        core 0 has logical processors 0 and 1, so both are excluded.
         """
         try:
             import psutil
             process = psutil.Process()
-            # Get all available CPUs
-            all_cpus = list(range(self._cpu_count))
-            # Exclude logical processors 0 and 1 (physical core 0 on SMT systems)
-            # On non-SMT systems, just exclude CPU 0
-            if self._cpu_count > 4:
-                # SMT system: exclude CPUs 0 and 1 (first physical core)
-                allowed_cpus = [cpu for cpu in all_cpus if cpu >= 2]
-            else:
-                # Small system: just exclude CPU 0
-                allowed_cpus = [cpu for cpu in all_cpus if cpu >= 1]
-
-            if allowed_cpus:
-                process.cpu_affinity(allowed_cpus)
-                self._logger.debug("CPU affinity set to cores: %s (excluded core 0)", allowed_cpus)
+            if self._affinity_cpus is None:
+                p_cores = _performance_cores()
+                if p_cores:
+                    self._affinity_cpus = list(p_cores[0])
+                else:
+                    # Get all available CPUs
+                    all_cpus = list(range(self._cpu_count))
+                    # Exclude logical processors 0 and 1 (physical core 0 on SMT systems)
+                    # On non-SMT systems, just exclude CPU 0
+                    if self._cpu_count > 4:
+                        # SMT system: exclude CPUs 0 and 1 (first physical core)
+                        self._affinity_cpus = [cpu for cpu in all_cpus if cpu >= 2]
+                    else:
+                        # Small system: just exclude CPU 0
+                        self._affinity_cpus = [cpu for cpu in all_cpus if cpu >= 1]
+                self._logger.debug("Transcription CPU affinity: %s (%s)", self._affinity_cpus,
+                                   "performance cores" if p_cores else "excluded core 0")
+
+            if self._affinity_cpus:
+                process.cpu_affinity(self._affinity_cpus)
         except ImportError:
             self._logger.debug("psutil not available, skipping CPU affinity")
         except Exception as e:
             self._logger.debug("Failed to set CPU affinity: %s", e)
 
+    def _lock_resident_memory(self) -> bool:
+        """Keep the loaded model resident in physical RAM.
+
+        whisper.cpp reads the GGML weights into its own buffers (no file mmap)
+        and pywhispercpp doesn't expose their addresses, so the process pages
+        are pinned as a whole right after loading:
+        - Windows: raise the hard minimum working set to the current size so
+          the memory manager won't trim model pages under memory pressure.
+        - POSIX: mlockall(MCL_CURRENT), subject to RLIMIT_MEMLOCK.
+
+        Returns:
+            True if memory was locked.
+        """
+        try:
+            import ctypes
+            if sys.platform == "win32":
+                import psutil
+                kernel32 = ctypes.windll.kernel32
+                kernel32.GetCurrentProcess.restype = ctypes.c_void_p
+                kernel32.SetProcessWorkingSetSizeEx.argtypes = [
+                    ctypes.c_void_p, ctypes.c_size_t, ctypes.c_size_t, ctypes.c_ulong,
+                ]
+                working_set = psutil.Process().memory_info().rss
+                min_ws = working_set + 64 * 1024 * 1024  # headroom for transcription buffers
+                max_ws = min_ws * 2
+                QUOTA_LIMITS_HARDWS_MIN_ENABLE = 0x1
+                QUOTA_LIMITS_HARDWS_MAX_DISABLE = 0x8
+                ok = kernel32.SetProcessWorkingSetSizeEx(
+                    kernel32.GetCurrentProcess(), min_ws, max_ws,
+                    QUOTA_LIMITS_HARDWS_MIN_ENABLE | QUOTA_LIMITS_HARDWS_MAX_DISABLE,
+                )
+                if not ok:
+                    self._logger.warning(
+                        "Failed to lock model in RAM (SetProcessWorkingSetSizeEx error %d)",
+                        ctypes.GetLastError(),
+                    )
+                    return False
+                self._logger.info("Model locked in RAM (min working set %d MB)",
+                                  min_ws // (1024 * 1024))
+                return True
+
+            libc = ctypes.CDLL(None, use_errno=True)
+            MCL_CURRENT = 1
+            if libc.mlockall(MCL_CURRENT) != 0:
+                self._logger.warning(
+                    "Failed to lock model in RAM (mlockall: %s). "
+                    "Raise RLIMIT_MEMLOCK (ulimit -l) to enable.",
+                    os.strerror(ctypes.get_errno()),
+                )
+                return False
+            self._logger.info("Model locked in RAM (mlockall)")
+            return True
+        except Exception as e:
+            self._logger.warning("Failed to lock model in RAM: %s", e)
+            return False
+
+    def _backend_cache_key(self) -> str:
+        return f"{self.model_name}|{_gpu_backend}|{self.gpu_device}"
+
+    def _load_backend_choice(self) -> Optional[dict]:
+        """Read the cached benchmark result for this model/backend/device."""
+        path = get_models_dir().parent / BACKEND_CACHE_FILE
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f).get(self._backend_cache_key())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self._logger.debug("Failed to read backend cache: %s", e)
+            return None
+        # Ignore results recorded under a different pywhispercpp build
+        if not isinstance(entry, dict) or entry.get("system_info") != _system_info:
+            return None
+        return entry
+
+    def _save_backend_choice(self, entry: dict) -> None:
+        """Persist a benchmark result, keeping entries for other models/devices."""
+        path = get_models_dir().parent / BACKEND_CACHE_FILE
+        try:
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            except (FileNotFoundError, ValueError):
+                data = {}
+            data[self._backend_cache_key()] = entry
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            self._logger.debug("Failed to save backend cache: %s", e)
+
+    def _time_model(self, model) -> float:
+        """Milliseconds for one transcription of 1s of silence (after a warmup run).
+
+        whisper.cpp pads input to the full 30s window unless audio_ctx is set,
+        so the encoder context is limited to the clip where the binding allows
+        it (the shared model resets audio_ctx on every transcription).
+        """
+        silence = np.zeros(_SR_DEFAULT, dtype=np.float32)
+        params = {}
+        if "audio_ctx" in _transcribe_param_names:
+            params["audio_ctx"] = self._audio_ctx_for(len(silence))
+        model.transcribe(silence, language="auto", **params)
+        start = time.perf_counter()
+        model.transcribe(silence, language="auto", **params)
+        return (time.perf_counter() - start) * 1000.0
+
+    def _benchmark_backends(self, fallback_path: Path) -> tuple[bool, object, Path]:
+        """Load the model on GPU and CPU and time both.
+
+        Each backend uses the model file it would load on its own (the
+        quantization pick depends on the backend), or fallback_path if that
+        file is not on disk. The result is cached so this runs once per
+        model/device.
+
+        Returns:
+            Tuple of (True if the GPU backend won, the winner's loaded model,
+            the winner's model file).
+        """
+        self._logger.info("Benchmarking %s backend vs CPU (first run only)...", _gpu_backend)
+        # The GPU model lives mostly in VRAM, so it stays loaded while the CPU
+        # model is timed; the winner is returned rather than loaded again
+        results = {}
+        for use_gpu in (True, False):
+            self.use_gpu = use_gpu
+            model_path = self._get_model_path()
+            if not model_path.exists():
+                model_path = fallback_path
+            model = self._create_model(model_path, use_gpu=use_gpu)
+            results[use_gpu] = (self._time_model(model), model, model_path)
+        gpu_ms = results[True][0]
+        cpu_ms = results[False][0]
+
+        use_gpu = gpu_ms <= cpu_ms
+        self.use_gpu = use_gpu
+        self._logger.info("Backend benchmark: %s %.0fms, CPU %.0fms -> using %s",
+                          _gpu_backend, gpu_ms, cpu_ms, _gpu_backend if use_gpu else "CPU")
+        self._save_backend_choice({
+            "backend": _gpu_backend if use_gpu else "CPU",
+            "device": self.gpu_device,
+            "gpu_ms": round(gpu_ms, 1),
+            "cpu_ms": round(cpu_ms, 1),
+            "system_info": _system_info,
+        })
+        _, model, model_path = results[use_gpu]
+        return use_gpu, model, model_path
+
+    def _create_model(self, model_path: Path, use_gpu: bool) -> object:
+        """Construct a private (uncached) pywhispercpp Model."""
+        return _new_model(str(model_path), use_gpu, self.gpu_device, self.n_threads)
+
     def _get_model_path(self) -> Path:
-        """Get path to GGML model file."""
-        return get_models_dir() / f"ggml-{self.model_name}.bin"
+        """Get path to GGML model file, applying the quantization preference."""
+        models_dir = get_models_dir()
+        base, configured_quant = _split_quantization(self.model_name)
+        quant = self.quantization
+        if quant == "auto":
+            # Only re-pick for models the user already chose a quantized variant of
+            quant = _select_quantization(self.use_gpu) if configured_quant else None
+        if quant and quant != configured_quant:
+            candidate = models_dir / f"ggml-{base}-{quant}.bin"
+            if candidate.exists():
+                self._logger.debug("Using %s instead of %s (quantization=%s)",
+                                   candidate.name, self.model_name, self.quantization)
+                return candidate
+        return models_dir / f"ggml-{self.model_name}.bin"
 
     def load_model(self) -> bool:
         """Load the Whisper model.
@@ -224,28 +699,56 @@ class WhisperEngine:
             if self._model is not None:
                 return True
 
+            # Apply a previous benchmark result before resolving the model file
+            benchmark_needed = False
+            if self._benchmark_backend:
+                choice = self._load_backend_choice()
+                if choice is None:
+                    benchmark_needed = True
+                else:
+                    self.use_gpu = choice.get("backend") != "CPU"
+
             model_path = self._get_model_path()
 
             if not model_path.exists():
-                self._last_error = f"Model not found: {model_path}"
-                self._logger.error(self._last_error)
-                return False
+                try:
+                    model_path = ensure_model(self.model_name)
+                except Exception as e:
+                    self._last_error = f"Model not found: {model_path} (download failed: {e})"
+                    self._logger.error("%s", self._last_error)
+                    return False
 
             try:
-                # GPU backend is used automatically when available
-                # Vulkan: universal (NVIDIA/AMD/Intel), CUDA: NVIDIA-only fallback
-                # gpu_device: -1 = auto, 0 = first GPU (usually discrete), 1 = second GPU
-                self._model = _Model(
-                    str(model_path),
-                    n_threads=self.n_threads,
-                    use_gpu=self.use_gpu,
-                    gpu_device=self.gpu_device,
-                )
+                benchmark_model = None
+                if benchmark_needed:
+                    try:
+                        self.use_gpu, benchmark_model, model_path = (
+                            self._benchmark_backends(model_path)
+                        )
+                    except Exception:
+                        self._logger.warning("Backend benchmark failed; using %s",
+                                             _gpu_backend, exc_info=True)
+                        self.use_gpu = True
+                with _shared_model_lock:
+                    key = (str(model_path), self.use_gpu, self.gpu_device, self.n_threads)
+                    if benchmark_model is not None:
+                        _adoptable_models[key] = benchmark_model
+                    try:
+                        self._model, self._transcribe_lock = _load_shared_model(*key)
+                    finally:
+                        # Not adopted if another engine already loaded this model
+                        _adoptable_models.clear()
                 self._last_error = None
 
+                # Compile optional Numba kernels now rather than on first transcription
+                _whisper_kernels.warmup()
+
+                if self.lock_model_in_ram:
+                    self._lock_resident_memory()
+
                 # Verify actual backend from system_info (not just config)
-                backend_in_system_info = get_gpu_backend()
-                has_device_selection = has_gpu_device_selection()
+                backend_in_system_info = _gpu_backend
+                has_device_selection = _has_gpu_init_params
 
                 if self.use_gpu:
                     if backend_in_system_info and has_device_selection:
@@ -265,8 +768,8 @@ class WhisperEngine:
                     device_str = "CPU"
 
                 self._logger.info(
-                    "Loaded %s model on %s with %d threads",
-                    self.model_name, device_str, self.n_threads
+                    "Loaded %s model (%s) on %s with %d threads",
+                    self.model_name, model_path.name, device_str, self.n_threads
                 )
                 return True
 
@@ -295,6 +798,17 @@ class WhisperEngine:
                 self._logger.exception("Failed to load Whisper model")
                 return False
 
+    def release_model(self) -> None:
+        """Drop this engine's model and clear the shared model cache.
+
+        Use before reloading with a different quantization or device. Other
+        engines keep their current model until they release it too.
+        """
+        with self._model_lock:
+            self._model = None
+            with _shared_model_lock:
+                _load_shared_model.cache_clear()
+
     def _transcribe_internal(self, audio: np.ndarray) -> str:
         """Internal transcription worker (runs in thread pool).
 
@@ -304,9 +818,38 @@ class WhisperEngine:
         Returns:
             Transcribed text.
         """
-        segments = self._model.transcribe(audio, translate=self.translate_to_english, language="auto")
-        text = " ".join(s.text.strip() for s in segments)
-        return text.strip()
+        params = {}
+        n_processors = None
+        n_threads = self.n_threads
+        if (
+            self._n_processors > 1 and not self.use_gpu
+            and len(audio) >= self._n_processors * _PARALLEL_MIN_SAMPLES
+        ):
+            n_processors = self._n_processors
+            n_threads = max(1, self.n_threads // n_processors)
+        if "n_threads" in _transcribe_param_names:
+            params["n_threads"] = n_threads
+        if self.dynamic_audio_ctx:
+            params["audio_ctx"] = self._audio_ctx_for(len(audio))
+        elif "audio_ctx" in _transcribe_param_names:
+            # Set on every call: pywhispercpp keeps params between transcriptions
+            # and the model may be shared with an engine using dynamic_audio_ctx
+            params["audio_ctx"] = 0
+        # whisper.cpp releases the GIL; a coarser switch interval means fewer
+        # GIL hand-offs from UI/audio threads while it runs
+        with self._transcribe_lock, _coarse_switch_interval():
+            segments = self._model.transcribe(
+                audio, n_processors=n_processors,
+                translate=self.translate_to_english, language="auto", **params
+            )
+        # Parts are stripped and non-empty, so the joined text needs no outer strip
+        return " ".join([text for text in (s.text.strip() for s in segments) if text])
+
+    @staticmethod
+    def _audio_ctx_for(n_samples: int, sample_rate: int = 16000) -> int:
+        """Encoder context size covering n_samples (capped at the full 30s window)."""
+        ctx = -(-n_samples * _AUDIO_CTX_PER_SECOND // sample_rate)
+        return max(1, min(_WHISPER_MAX_AUDIO_CTX, ctx))
 
     def _chunk_audio(self, audio: np.ndarray, sample_rate: int = 16000) -> List[np.ndarray]:
         """Split audio into overlapping chunks for long recordings.
@@ -319,8 +862,14 @@ class WhisperEngine:
             List of audio chunks (each ~60 seconds with 5s overlap)
         """
         total_samples = len(audio)
-        chunk_samples = CHUNK_DURATION_SECONDS * sample_rate
-        overlap_samples = CHUNK_OVERLAP_SECONDS * sample_rate
+        if sample_rate == _SR_DEFAULT:
+            chunk_samples = _CHUNK_SAMPLES
+            step_samples = _STEP_SAMPLES
+            min_tail_samples = _MIN_TAIL_SAMPLES
+        else:
+            chunk_samples = CHUNK_DURATION_SECONDS * sample_rate
+            step_samples = chunk_samples - CHUNK_OVERLAP_SECONDS * sample_rate
+            min_tail_samples = CHUNK_MIN_TAIL_SECONDS * sample_rate
 
         # If audio fits in one chunk, return as-is
         if total_samples <= chunk_samples:
@@ -333,17 +882,23 @@ class WhisperEngine:
             chunks.append(audio[start:end])
 
             # Move start forward by chunk size minus overlap
-            start += chunk_samples - overlap_samples
+            start += step_samples
 
             # Don't create tiny final chunks (< 10 seconds)
-            if total_samples - start < sample_rate * 10 and start < total_samples:
+            if total_samples - start < min_tail_samples and start < total_samples:
                 # Extend last chunk to include remaining audio
                 if chunks:
-                    chunks[-1] = audio[start - (chunk_samples - overlap_samples):]
+                    chunks[-1] = audio[start - step_samples:]
                 break
 
         return chunks
 
+    def _is_silent(self, audio: np.ndarray) -> bool:
+        """Check if an audio chunk is below the silence threshold (RMS, dBFS)."""
+        if self._silence_rms <= 0.0 or audio.size == 0:
+            return False
+        return _whisper_kernels.rms(audio) < self._silence_rms
+
     def _transcribe_with_timeout(self, audio: np.ndarray) -> str:
         """Transcribe a single audio chunk with timeout protection.
 
@@ -406,6 +961,47 @@ class WhisperEngine:
 
         return joined.strip()
 
+    def _as_float32(
+        self,
+        audio: np.ndarray,
+        valid_length: int,
+        scratch: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """Return the first valid_length samples of audio as a float32 array.
+
+        C-contiguous float32 input (what AudioRecorder delivers) is returned as
+        a view without copying. Other dtypes and strided views are converted
+        into a reusable scratch buffer instead of allocating a new array per
+        call; pywhispercpp would otherwise make its own contiguous copy.
+        Signed integer PCM (int8/int16/int32) is scaled to [-1, 1).
+
+        Args:
+            audio: Audio samples (mono).
+            valid_length: Number of leading samples to use.
+            scratch: Optional caller-owned float32 buffer for the conversion.
+
+        Returns:
+            float32 view of the valid samples.
+        """
+        view = audio[:valid_length]
+        if view.dtype == np.float32 and view.flags.c_contiguous:
+            return view
+
+        if scratch is None or scratch.dtype != np.float32 or scratch.size < valid_length:
+            current = self._fp32_scratch.size if self._fp32_scratch is not None else 0
+            if current < valid_length:
+                # Grow geometrically so recordings of increasing length don't
+                # reallocate on every call
+                self._fp32_scratch = np.empty(
+                    max(valid_length, 2 * current, _CHUNK_SAMPLES), dtype=np.float32
+                )
+            scratch = self._fp32_scratch
+
+        buf = scratch[:valid_length]
+        # Integer PCM is rescaled to [-1, 1) in the same pass as the cast
+        _whisper_kernels.to_float32(view, buf, _PCM_SCALE.get(view.dtype, 1.0))
+        return buf
+
     def transcribe(self, audio: np.ndarray, sample_rate: int = 16000) -> str:
         """Transcribe audio to text with chunking for long recordings.
 
@@ -416,20 +1012,45 @@ class WhisperEngine:
             audio: Audio samples as numpy array (mono, 16kHz expected)
             sample_rate: Sample rate (should be 16000 for Whisper)
 
+        Returns:
+            Transcribed text or empty string on error/timeout.
+        """
+        return self.transcribe_into(audio, len(audio), sample_rate)
+
+    def transcribe_into(
+        self,
+        audio: np.ndarray,
+        valid_length: int,
+        sample_rate: int = 16000,
+        *,
+        scratch: Optional[np.ndarray] = None,
+    ) -> str:
+        """Transcribe the leading samples of a caller-owned buffer.
+
+        Streaming variant of transcribe() for callers that reuse one audio
+        buffer across recordings (e.g. a capture ring buffer). Only the first
+        valid_length samples are read. Non-float32 input is converted into
+        scratch (or an engine-owned buffer reused across calls).
+
+        Args:
+            audio: Audio buffer (mono, 16kHz expected).
+            valid_length: Number of valid samples at the start of audio.
+            sample_rate: Sample rate (should be 16000 for Whisper).
+            scratch: Optional float32 buffer used for dtype conversion.
+
         Returns:
             Transcribed text or empty string on error/timeout.
         """
         if not self.load_model():
             return ""
 
-        # Set CPU affinity to exclude core 0 for system responsiveness
+        # Pin to P-cores (hybrid CPUs) or exclude core 0 for system responsiveness
         # Only relevant for CPU mode - GPU inference doesn't benefit from this
         if not self.use_gpu:
-            self._set_cpu_affinity_exclude_core0()
+            self._set_transcription_affinity()
 
         try:
-            if audio.dtype != np.float32:
-                audio = audio.astype(np.float32)
+            audio = self._as_float32(audio, valid_length, scratch)
 
             # Split into chunks for long recordings
             chunks = self._chunk_audio(audio, sample_rate)
@@ -445,6 +1066,9 @@ class WhisperEngine:
 
             results = []
             for i, chunk in enumerate(chunks):
+                if self._is_silent(chunk):
+                    self._logger.debug("Skipping silent chunk %d/%d", i + 1, len(chunks))
+                    continue
                 self._logger.debug("Transcribing chunk %d/%d", i + 1, len(chunks))
                 text = self._transcribe_with_timeout(chunk)
                 if text:
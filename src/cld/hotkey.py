@@ -2,6 +2,7 @@
 
 import logging
 import queue
+import re
 import threading
 import time
 from typing import Callable, Optional
@@ -20,6 +21,29 @@ from cld.errors import HotkeyError
 # Toggle mode debounce time in seconds (prevents rapid key presses from triggering multiple start/stop cycles)
 TOGGLE_DEBOUNCE_SECONDS = 0.3
 
+# Plain key names in hotkey strings and their pynput <name> forms
+_HOTKEY_KEY_MAP = {
+    "ctrl": "ctrl",
+    "control": "ctrl",
+    "shift": "shift",
+    "alt": "alt",
+    "cmd": "cmd",
+    "command": "cmd",
+    "space": "space",
+    "enter": "enter",
+    "return": "enter",
+    "tab": "tab",
+    "esc": "esc",
+    "escape": "esc",
+}
+# Matches a whole (lowercased) hotkey token that needs <...> brackets
+_HOTKEY_TOKEN_RE = re.compile(r"^(%s|f\d+)$" % "|".join(_HOTKEY_KEY_MAP))
+
+
+def _bracket_hotkey_token(match: re.Match) -> str:
+    name = match.group(1)
+    return f"<{_HOTKEY_KEY_MAP.get(name, name)}>"
+
 
 class HotkeyListener:
     """Listens for global hotkey events.
@@ -49,7 +73,7 @@ class HotkeyListener:
 
         self._listener: Optional[keyboard.Listener] = None
         self._is_recording = False
-        self._pressed_keys: set = set()
+        self._pressed_mask = 0
         self._hotkey_active = False
         self._last_toggle_time: float = 0
         self._lock = threading.Lock()
@@ -58,7 +82,6 @@ class HotkeyListener:
             queue.Queue(maxsize=8)
         )
         self._worker_thread: Optional[threading.Thread] = None
-        self._worker_stop = threading.Event()
 
         # Track if hotkey uses specific modifier variants (not generic)
         # This affects key normalization during matching
@@ -73,11 +96,94 @@ class HotkeyListener:
                 message = f"{message}: {_PYNPUT_IMPORT_ERROR}"
             raise HotkeyError(message)
 
+        # VK lookup tables for _normalize_key, built once (it runs per keystroke)
+        self._vk_special_map, self._vk_char_map = self._build_vk_maps()
+        alt_variants = [keyboard.Key.alt_l, keyboard.Key.alt_r]
+        if hasattr(keyboard.Key, "alt_gr"):
+            alt_variants.append(keyboard.Key.alt_gr)
+        self._alt_variant_set = frozenset(alt_variants)
+        self._char_keycode_cache: dict[str, "keyboard.KeyCode"] = {}
+
         # Parse the hotkey
         self._hotkey_keys = self._parse_hotkey(hotkey)
         if not self._hotkey_keys:
             raise HotkeyError(f"Hotkey '{hotkey}' did not map to any keys")
 
+        # One bit per hotkey key; pressed state is tracked as an int mask
+        self._key_to_bit = {k: 1 << i for i, k in enumerate(self._hotkey_keys)}
+        self._needed_mask = (1 << len(self._hotkey_keys)) - 1
+        # Raw pynput key -> hotkey bit (0 for other keys), filled on first sight
+        self._raw_to_bit: dict = {}
+
+    def _build_vk_maps(self) -> tuple[dict, dict]:
+        """Build the VK code lookup tables used by _normalize_key.
+
+        Returns:
+            (vk_special_map, vk_char_map): VK code -> keyboard.Key for special
+            keys (honouring the specific-variant flags), and VK code -> char.
+        """
+        # Map Windows VK codes to keyboard.Key for special keys
+        # Use specific variants if hotkey requires them
+        if self._use_specific_alt:
+            vk_alt_map = {
+                164: keyboard.Key.alt_l,   # VK_LMENU (left alt)
+                # VK_RMENU (right alt / alt_gr)
+                165: getattr(keyboard.Key, "alt_gr", keyboard.Key.alt_r),
+            }
+        else:
+            vk_alt_map = {
+                164: keyboard.Key.alt,     # VK_LMENU -> generic alt
+                165: keyboard.Key.alt,     # VK_RMENU -> generic alt
+            }
+
+        if self._use_specific_ctrl:
+            vk_ctrl_map = {
+                162: keyboard.Key.ctrl_l,  # VK_LCONTROL
+                163: keyboard.Key.ctrl_r,  # VK_RCONTROL
+            }
+        else:
+            vk_ctrl_map = {
+                162: keyboard.Key.ctrl,    # VK_LCONTROL -> generic ctrl
+                163: keyboard.Key.ctrl,    # VK_RCONTROL -> generic ctrl
+            }
+
+        if self._use_specific_shift:
+            vk_shift_map = {
+                160: keyboard.Key.shift_l, # VK_LSHIFT
+                161: keyboard.Key.shift_r, # VK_RSHIFT
+            }
+        else:
+            vk_shift_map = {
+                160: keyboard.Key.shift,   # VK_LSHIFT -> generic shift
+                161: keyboard.Key.shift,   # VK_RSHIFT -> generic shift
+            }
+
+        vk_special_map = {
+            32: keyboard.Key.space,      # VK_SPACE
+            13: keyboard.Key.enter,      # VK_RETURN
+            9: keyboard.Key.tab,         # VK_TAB
+            27: keyboard.Key.esc,        # VK_ESCAPE
+            **vk_alt_map,
+            **vk_ctrl_map,
+            **vk_shift_map,
+        }
+
+        # Map VK codes to characters (needed when Ctrl/Alt is held)
+        # When modifier is pressed, pynput sends VK codes instead of chars
+        vk_char_map = {
+            # Symbol keys
+            186: ';', 187: '=', 188: ',', 189: '-', 190: '.',
+            191: '/', 192: '`', 219: '[', 220: '\\', 221: ']', 222: "'",
+        }
+        # Add letters A-Z (VK 65-90)
+        for i in range(65, 91):
+            vk_char_map[i] = chr(i).lower()
+        # Add numbers 0-9 (VK 48-57)
+        for i in range(48, 58):
+            vk_char_map[i] = chr(i)
+
+        return vk_special_map, vk_char_map
+
     def _parse_hotkey(self, hotkey_str: str) -> set:
         """Parse hotkey string to a set of keys.
 
@@ -152,45 +258,14 @@ class HotkeyListener:
         return None
 
     def _normalize_hotkey_string(self, hotkey_str: str) -> str:
-        parts = [part.strip() for part in hotkey_str.split("+") if part.strip()]
+        parts = [part.strip().lower() for part in hotkey_str.split("+") if part.strip()]
         if not parts:
             return hotkey_str
-
-        key_map = {
-            "ctrl": "<ctrl>",
-            "control": "<ctrl>",
-            "shift": "<shift>",
-            "alt": "<alt>",
-            "cmd": "<cmd>",
-            "command": "<cmd>",
-            "space": "<space>",
-            "enter": "<enter>",
-            "return": "<enter>",
-            "tab": "<tab>",
-            "esc": "<esc>",
-            "escape": "<esc>",
-        }
-
-        normalized_parts = []
-        for part in parts:
-            lowered = part.lower()
-            if lowered.startswith("<") and lowered.endswith(">"):
-                normalized_parts.append(lowered)
-                continue
-            if lowered in key_map:
-                normalized_parts.append(key_map[lowered])
-                continue
-            if lowered.startswith("f") and lowered[1:].isdigit():
-                normalized_parts.append(f"<{lowered}>")
-                continue
-            normalized_parts.append(lowered)
-
-        return "+".join(normalized_parts)
+        return "+".join(_HOTKEY_TOKEN_RE.sub(_bracket_hotkey_token, part) for part in parts)
 
     def _ensure_worker(self) -> None:
         if self._worker_thread and self._worker_thread.is_alive():
             return
-        self._worker_stop.clear()
         self._worker_thread = threading.Thread(
             target=self._event_worker,
             name="cld-hotkey-worker",
@@ -199,11 +274,9 @@ class HotkeyListener:
         self._worker_thread.start()
 
     def _event_worker(self) -> None:
-        while not self._worker_stop.is_set():
-            try:
-                item = self._event_queue.get(timeout=0.1)
-            except queue.Empty:
-                continue
+        # Blocks until an event arrives; stop() wakes it with a None sentinel
+        while True:
+            item = self._event_queue.get()
             if item is None:
                 return
             label, callback = item
@@ -221,6 +294,14 @@ class HotkeyListener:
         except queue.Full:
             self._logger.warning("Dropping hotkey event '%s'; queue full", label)
 
+    def _keycode_for_char(self, char: str) -> "keyboard.KeyCode":
+        """Return a cached KeyCode for a character (avoids per-keystroke allocation)."""
+        keycode = self._char_keycode_cache.get(char)
+        if keycode is None:
+            keycode = keyboard.KeyCode.from_char(char)
+            self._char_keycode_cache[char] = keycode
+        return keycode
+
     def _normalize_key(self, key, for_matching: bool = True) -> Optional[object]:
         """Normalize a key to a comparable form.
 
@@ -232,76 +313,19 @@ class HotkeyListener:
         """
         # Handle KeyCode objects with virtual key codes
         if hasattr(key, "vk") and key.vk is not None:
-            # Map Windows VK codes to keyboard.Key for special keys
-            # Use specific variants if hotkey requires them
-            if self._use_specific_alt:
-                vk_alt_map = {
-                    164: keyboard.Key.alt_l,   # VK_LMENU (left alt)
-                    165: getattr(keyboard.Key, "alt_gr", keyboard.Key.alt_r),  # VK_RMENU (right alt / alt_gr)
-                }
-            else:
-                vk_alt_map = {
-                    164: keyboard.Key.alt,     # VK_LMENU -> generic alt
-                    165: keyboard.Key.alt,     # VK_RMENU -> generic alt
-                }
-
-            if self._use_specific_ctrl:
-                vk_ctrl_map = {
-                    162: keyboard.Key.ctrl_l,  # VK_LCONTROL
-                    163: keyboard.Key.ctrl_r,  # VK_RCONTROL
-                }
-            else:
-                vk_ctrl_map = {
-                    162: keyboard.Key.ctrl,    # VK_LCONTROL -> generic ctrl
-                    163: keyboard.Key.ctrl,    # VK_RCONTROL -> generic ctrl
-                }
-
-            if self._use_specific_shift:
-                vk_shift_map = {
-                    160: keyboard.Key.shift_l, # VK_LSHIFT
-                    161: keyboard.Key.shift_r, # VK_RSHIFT
-                }
-            else:
-                vk_shift_map = {
-                    160: keyboard.Key.shift,   # VK_LSHIFT -> generic shift
-                    161: keyboard.Key.shift,   # VK_RSHIFT -> generic shift
-                }
-
-            vk_special_map = {
-                32: keyboard.Key.space,      # VK_SPACE
-                13: keyboard.Key.enter,      # VK_RETURN
-                9: keyboard.Key.tab,         # VK_TAB
-                27: keyboard.Key.esc,        # VK_ESCAPE
-                **vk_alt_map,
-                **vk_ctrl_map,
-                **vk_shift_map,
-            }
-            if key.vk in vk_special_map:
-                return vk_special_map[key.vk]
-
-            # Map VK codes to characters (needed when Ctrl/Alt is held)
-            # When modifier is pressed, pynput sends VK codes instead of chars
-            vk_char_map = {
-                # Symbol keys
-                186: ';', 187: '=', 188: ',', 189: '-', 190: '.',
-                191: '/', 192: '`', 219: '[', 220: '\\', 221: ']', 222: "'",
-            }
-            # Add letters A-Z (VK 65-90)
-            for i in range(65, 91):
-                vk_char_map[i] = chr(i).lower()
-            # Add numbers 0-9 (VK 48-57)
-            for i in range(48, 58):
-                vk_char_map[i] = chr(i)
-
-            if key.vk in vk_char_map:
-                return keyboard.KeyCode.from_char(vk_char_map[key.vk])
+            special = self._vk_special_map.get(key.vk)
+            if special is not None:
+                return special
+            char = self._vk_char_map.get(key.vk)
+            if char is not None:
+                return self._keycode_for_char(char)
 
         if hasattr(key, "char") and key.char:
             if key.char == " ":
                 return keyboard.Key.space
             if key.char in ("\n", "\r"):
                 return keyboard.Key.enter
-            return keyboard.KeyCode.from_char(key.char.lower())
+            return self._keycode_for_char(key.char.lower())
 
         # Handle left/right modifier variants
         # When for_matching=True (key presses), normalize to generic form
@@ -321,10 +345,7 @@ class HotkeyListener:
                 return key
 
             # Alt variants (including alt_gr)
-            alt_keys = [keyboard.Key.alt_l, keyboard.Key.alt_r]
-            if hasattr(keyboard.Key, "alt_gr"):
-                alt_keys.append(keyboard.Key.alt_gr)
-            if key in alt_keys:
+            if key in self._alt_variant_set:
                 if not self._use_specific_alt:
                     return keyboard.Key.alt
                 # Keep specific variant - but note that alt_r and alt_gr
@@ -343,15 +364,16 @@ class HotkeyListener:
         We intentionally do NOT log individual key presses for privacy reasons.
         Only the hotkey match itself is logged.
         """
-        normalized = self._normalize_key(key, for_matching=True)
-        if normalized is None:
+        bit = self._raw_key_bit(key)
+        if not bit:
+            # Not part of the hotkey; cannot change match state
             return
 
         with self._lock:
-            self._pressed_keys.add(normalized)
+            self._pressed_mask |= bit
 
             # Check if hotkey combination is pressed
-            if self._hotkey_keys.issubset(self._pressed_keys):
+            if (self._pressed_mask & self._needed_mask) == self._needed_mask:
                 if self._hotkey_active:
                     return
                 self._hotkey_active = True
@@ -376,41 +398,53 @@ class HotkeyListener:
 
     def _on_release(self, key):
         """Handle key release event."""
-        normalized = self._normalize_key(key, for_matching=True)
-        if normalized is None:
+        bit = self._raw_key_bit(key)
+        if not bit:
             return
 
         with self._lock:
-            self._pressed_keys.discard(normalized)
-
-            # Check if released key is part of hotkey (compare by value, not object identity)
-            is_hotkey_key = self._key_in_set(normalized, self._hotkey_keys)
-
-            if is_hotkey_key:
-                self._hotkey_active = False
+            self._pressed_mask &= ~bit
+            self._hotkey_active = False
 
             # In push-to-talk mode, release any hotkey key to stop
             if self.mode == "push-to-talk" and self._is_recording:
-                if is_hotkey_key:
-                    self._is_recording = False
-                    self._enqueue_event("stop", self.on_stop)
-
-    def _key_in_set(self, key, key_set) -> bool:
-        """Check if a key is in a set, handling KeyCode comparison properly."""
-        # Direct membership check
-        if key in key_set:
-            return True
+                self._is_recording = False
+                self._enqueue_event("stop", self.on_stop)
+
+    def _raw_key_bit(self, key) -> int:
+        """Return the hotkey bit for a raw pynput key event.
+
+        The result is cached per raw key (pynput reuses Key members and
+        KeyCodes hash by value), so each physical key is normalized once.
+        """
+        bit = self._raw_to_bit.get(key)
+        if bit is None:
+            normalized = self._normalize_key(key, for_matching=True)
+            bit = self._key_bit(normalized) if normalized is not None else 0
+            self._raw_to_bit[key] = bit
+        return bit
+
+    def _key_bit(self, key) -> int:
+        """Return the hotkey bit for a normalized key (0 if not a hotkey key).
+
+        Compares by value rather than object identity, so KeyCode objects
+        match on their char as well.
+        """
+        # Direct lookup
+        bit = self._key_to_bit.get(key, 0)
+        if bit:
+            return bit
 
         # For KeyCode objects, compare by char value
         if hasattr(key, 'char') and key.char:
-            for k in key_set:
+            for k, k_bit in self._key_to_bit.items():
                 if hasattr(k, 'char') and k.char == key.char:
-                    return True
+                    return k_bit
                 # Also check if it's a raw string
                 if isinstance(k, str) and k == key.char:
-                    return True
+                    return k_bit
 
-        return False
+        return 0
 
     def start(self) -> bool:
         """Start listening for hotkeys.
@@ -448,15 +482,15 @@ class HotkeyListener:
         if self._listener is not None:
             self._listener.stop()
             self._listener = None
-            self._pressed_keys.clear()
+            self._pressed_mask = 0
             self._is_recording = False
 
         # Stop worker thread
-        self._worker_stop.set()
-        try:
-            self._event_queue.put_nowait(None)
-        except queue.Full:
-            pass
+        if self._worker_thread and self._worker_thread.is_alive():
+            try:
+                self._event_queue.put(None, timeout=1.0)
+            except queue.Full:
+                self._logger.warning("Hotkey event queue full; worker not signalled to stop")
         if self._worker_thread:
             self._worker_thread.join(timeout=1.0)
             self._worker_thread = None
@@ -1,18 +1,42 @@
 """Model management for CLD - download, validation, and caching of GGML models."""
 
+import base64
+import contextlib
+import functools
 import hashlib
+import http.client
 import json
 import logging
+import mmap
 import os
+import shutil
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.parse
 import urllib.request
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Callable, Optional
+from types import MappingProxyType
+from typing import Callable, Iterable, Mapping, Optional
+
+try:
+    import blake3 as _blake3
+except ImportError:
+    _blake3 = None
+
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
 
 logger = logging.getLogger(__name__)
 
 
-# GGML Model metadata for pywhispercpp
-WHISPER_MODELS = {
+# GGML Model metadata for pywhispercpp (read-only; wrapped below)
+_WHISPER_MODELS = {
     "small": {
         "file": "ggml-small.bin",
         "size": "488MB",
@@ -39,16 +63,68 @@ WHISPER_MODELS = {
     },
 }
 
+
+def _with_derived_fields(info: dict) -> dict:
+    """Add integer fields derived from the display strings, computed once."""
+    return {
+        **info,
+        "ram_bytes": int(float(info["ram"].rstrip("GB")) * 1024**3),
+        # Accepted file size range for validation (within 20% of expected)
+        "size_lo": int(info["size_bytes"] * 0.8),
+        "size_hi": int(info["size_bytes"] * 1.2),
+    }
+
+
+WHISPER_MODELS = MappingProxyType(
+    {name: MappingProxyType(_with_derived_fields(info)) for name, info in _WHISPER_MODELS.items()}
+)
+
 # Base URL for GGML model downloads
 GGML_BASE_URL = "https://huggingface.co/ggerganov/whisper.cpp/resolve/main"
 
-# Local metadata file stores MD5 hashes of downloaded models
+# Seconds a model-file existence check is reused
+EXISTS_CACHE_TTL = 1.0
+
+# Logical CPU count, fixed for the process
+_CPU_COUNT = os.cpu_count() or 1
+
+# Local metadata file stores hashes of downloaded models
 # This allows integrity verification without hardcoded hashes that break on updates
 METADATA_FILE = "models.json"
 
+# Hash algorithm for new metadata entries: BLAKE3 (SIMD, multithreaded) when
+# the optional blake3 package is installed, MD5 otherwise. Entries record
+# their algorithm, so either can be verified later.
+HASH_ALGO = "blake3" if _blake3 is not None else "md5"
+
+# Read size for streaming file hashes
+HASH_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Read size for streaming model downloads
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Download progress callbacks: at most every 0.5s, and only after 1 MiB more
+PROGRESS_INTERVAL_NS = 500_000_000
+PROGRESS_MIN_BYTES = 1024 * 1024
 
+# Worker processes used by ModelManager.verify_all (one model per process)
+VERIFY_MAX_WORKERS = 3
+
+# Downloads at least this large are fetched as concurrent byte ranges
+PARALLEL_DOWNLOAD_MIN_BYTES = 64 * 1024 * 1024
+DOWNLOAD_SEGMENTS = 4
+
+# Idle keep-alive connections kept per host (one per parallel segment)
+HTTP_POOL_SIZE = DOWNLOAD_SEGMENTS
+HTTP_TIMEOUT = 30
+HTTP_MAX_REDIRECTS = 5
+# Model files are already compressed; never ask for gzip
+HTTP_HEADERS = {"Accept-Encoding": "identity", "User-Agent": "claudecli-dictate"}
+
+
+@functools.lru_cache(maxsize=1)
 def get_models_dir() -> Path:
-    """Get CLD models directory in LOCALAPPDATA."""
+    """Get CLD models directory in LOCALAPPDATA (resolved once per process)."""
     local_app_data = os.environ.get("LOCALAPPDATA")
     if local_app_data:
         return Path(local_app_data) / "CLD" / "models"
@@ -62,84 +138,672 @@ def setup_model_cache() -> None:
     logger.debug("Models directory: %s", models_dir)
 
 
+def _expected_size_range(filename: str) -> Optional[tuple[int, int]]:
+    """Look up the accepted (min, max) size of a known model file."""
+    for info in WHISPER_MODELS.values():
+        if info["file"] == filename:
+            return info["size_lo"], info["size_hi"]
+    return None
+
+
+def _progress_reporter(
+    progress_callback: Optional[Callable[[int, int, float], None]],
+    start_bytes: int = 0,
+) -> Callable[[int, int], None]:
+    """Build a (downloaded, total) hook that forwards to progress_callback.
+
+    Calls are rate-limited to one per PROGRESS_INTERVAL_NS and at least
+    PROGRESS_MIN_BYTES of progress; the byte check runs first so most calls
+    return without reading the clock.
+    """
+    last_time_ns = time.monotonic_ns()
+    last_downloaded = start_bytes
+
+    def reporthook(downloaded: int, total_size: int) -> None:
+        nonlocal last_time_ns, last_downloaded
+        bytes_delta = downloaded - last_downloaded
+        if progress_callback is None or bytes_delta < PROGRESS_MIN_BYTES:
+            return
+        now_ns = time.monotonic_ns()
+        time_delta_ns = now_ns - last_time_ns
+        if time_delta_ns < PROGRESS_INTERVAL_NS:
+            return
+        speed_mbps = bytes_delta * 1e9 / time_delta_ns / (1024 * 1024)
+        progress_callback(downloaded, total_size, speed_mbps)
+        last_time_ns = now_ns
+        last_downloaded = downloaded
+
+    return reporthook
+
+
+def ensure_model(
+    model_name: str,
+    quant: Optional[str] = None,
+    progress_callback: Optional[Callable[[int, int, float], None]] = None,
+) -> Path:
+    """Return the path to a GGML model, downloading it first if missing.
+
+    Fetches the pre-quantized file from the whisper.cpp Hugging Face repo so
+    nothing is converted at load time. Partial downloads are kept as
+    ``<file>.part`` and resumed with an HTTP Range request.
+
+    Args:
+        model_name: Model name (e.g., 'medium', 'medium-q5_0').
+        quant: Optional quantization suffix appended to model_name (e.g., 'q8_0').
+        progress_callback: Called with (downloaded_bytes, total_bytes, speed_mbps).
+
+    Returns:
+        Path to the model file.
+
+    Raises:
+        urllib.error.URLError: Download failed.
+        OSError: Download incomplete, size mismatch, or disk error.
+    """
+
+    filename = f"ggml-{model_name}-{quant}.bin" if quant else f"ggml-{model_name}.bin"
+    models_dir = get_models_dir()
+    target_path = models_dir / filename
+    if target_path.exists():
+        return target_path
+
+    models_dir.mkdir(parents=True, exist_ok=True)
+    part_path = target_path.with_name(filename + ".part")
+    url = f"{GGML_BASE_URL}/{filename}"
+
+    offset = part_path.stat().st_size if part_path.exists() else 0
+    headers = {"Range": f"bytes={offset}-"} if offset else None
+
+    logger.info("Downloading model %s from %s (resume at %d bytes)", filename, url, offset)
+    try:
+        with _http_pool.request("GET", url, headers) as response:
+            if offset and response.status != 206:
+                # Server ignored the Range header; start over
+                offset = 0
+            length = response.headers.get("Content-Length")
+            total = offset + int(length) if length else 0
+
+            downloaded = offset
+            reporthook = _progress_reporter(progress_callback, offset)
+            with open(part_path, "ab" if offset else "wb") as f:
+                for chunk in iter(lambda: response.read(DOWNLOAD_CHUNK_SIZE), b""):
+                    f.write(chunk)
+                    downloaded += len(chunk)
+                    reporthook(downloaded, total)
+    except urllib.error.HTTPError as e:
+        if e.code != 416 or not offset:
+            raise
+        # Range not satisfiable - the .part file is already complete
+    else:
+        if total and downloaded != total:
+            raise OSError(f"Incomplete download of {filename}: {downloaded}/{total} bytes")
+
+    actual_size = part_path.stat().st_size
+    size_range = _expected_size_range(filename)
+    if size_range and not size_range[0] <= actual_size <= size_range[1]:
+        part_path.unlink()
+        raise OSError(f"Model file size unexpected: {actual_size / (1024*1024):.0f}MB")
+
+    os.replace(part_path, target_path)
+    logger.info("Model download complete: %s", filename)
+    return target_path
+
+
+def _dump_metadata(metadata: dict) -> bytes:
+    """Serialize model metadata in the compact on-disk JSON form."""
+    if _orjson is not None:
+        return _orjson.dumps(metadata, option=_orjson.OPT_SORT_KEYS)
+    return json.dumps(metadata, separators=(",", ":"), sort_keys=True).encode()
+
+
+def _parse_metadata(data: bytes) -> dict:
+    """Parse the on-disk metadata JSON (orjson when installed)."""
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+@functools.lru_cache(maxsize=2)
+def _native_hash_command(algo: str) -> Optional[tuple[str, ...]]:
+    """Command prefix of a native hashing tool for algo, if one is on PATH."""
+    if algo == "blake3":
+        tool = shutil.which("b3sum")
+        return (tool, "--no-names") if tool else None
+    if algo == "md5":
+        tool = shutil.which("md5sum")
+        if tool:
+            return (tool,)
+        if sys.platform == "win32":
+            tool = shutil.which("certutil")
+            return (tool, "-hashfile") if tool else None
+    return None
+
+
+def _compute_hash_native(file_path: Path, algo: str) -> Optional[str]:
+    """Hash a file with a native tool; None if unavailable or it failed."""
+    command = _native_hash_command(algo)
+    if command is None:
+        return None
+    args = [*command, str(file_path)]
+    if command[-1] == "-hashfile":
+        args.append("MD5")
+    try:
+        result = subprocess.run(
+            args,
+            capture_output=True,
+            text=True,
+            check=True,
+            creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+        )
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.debug("Native %s hash failed: %s", algo, e)
+        return None
+    # b3sum/md5sum: "<hex>  <name>"; certutil: the digest on its own line
+    # (space-separated byte pairs on older Windows versions)
+    expected_len = 64 if algo == "blake3" else 32
+    for line in result.stdout.lower().splitlines():
+        fields = line.split()
+        if not fields:
+            continue
+        for token in (fields[0], "".join(fields)):
+            if len(token) == expected_len and all(c in "0123456789abcdef" for c in token):
+                return token
+    return None
+
+
+def _compute_hash(file_path: Path, algo: str = HASH_ALGO, prefer_native: bool = True) -> str:
+    """Compute the hex digest of a file ("blake3" or "md5").
+
+    BLAKE3 uses the blake3 module when installed. Otherwise, with
+    prefer_native, a native tool (b3sum/md5sum/certutil) is tried before the
+    Python MD5 loop. Module-level so verify_all can run it in worker processes.
+    """
+    if algo == "blake3" and _blake3 is not None:
+        hasher = _new_hasher(algo)
+        hasher.update_mmap(str(file_path))
+        return hasher.hexdigest()
+    if prefer_native:
+        native_hash = _compute_hash_native(file_path, algo)
+        if native_hash:
+            return native_hash
+    if algo == "blake3":
+        raise RuntimeError("blake3 hashing needs the blake3 package or b3sum")
+    md5_hash = hashlib.md5()
+    fd = os.open(file_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        # Hash the mapped file in place: no per-chunk bytes objects, and
+        # hashlib releases the GIL for the whole buffer
+        try:
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mm, "madvise"):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                md5_hash.update(mm)
+            return md5_hash.hexdigest()
+        except (ValueError, OSError):
+            # Empty file or not mappable - fall back to raw fd reads
+            pass
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        while chunk := os.read(fd, HASH_CHUNK_SIZE):
+            md5_hash.update(chunk)
+    finally:
+        os.close(fd)
+    return md5_hash.hexdigest()
+
+
+def _new_hasher(algo: str = HASH_ALGO):
+    """Create an incremental hasher for algo ("blake3" or "md5")."""
+    if algo == "blake3":
+        return _blake3.blake3(max_threads=_blake3.blake3.AUTO)
+    return hashlib.md5()
+
+
+def _proc_cpuinfo_flags() -> Optional[frozenset]:
+    """CPU flags from /proc/cpuinfo, or None where it isn't available."""
+    try:
+        with open("/proc/cpuinfo", "r", encoding="utf-8", errors="replace") as f:
+            for line in f:
+                if line.startswith("flags"):
+                    return frozenset(line.partition(":")[2].split())
+    except OSError:
+        pass
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def _cpu_capabilities() -> tuple[bool, tuple[str, ...], tuple[str, ...]]:
+    """Probe CPU instruction sets once per process (see check_cpu_capabilities)."""
+    supported = []
+    missing = []
+
+    try:
+        try:
+            # Linux: read the kernel's flag list directly; the cpuinfo
+            # package is much slower (it may spawn a subprocess)
+            flags = _proc_cpuinfo_flags()
+            if flags is None:
+                import cpuinfo
+
+                info = cpuinfo.get_cpu_info()
+                flags = info.get("flags", [])
+
+            features_to_check = ["sse4_1", "avx", "avx2", "avx512f"]
+            for feature in features_to_check:
+                if feature in flags:
+                    supported.append(feature.upper().replace("_", "."))
+                else:
+                    missing.append(feature.upper().replace("_", "."))
+
+        except ImportError:
+            supported = ["SSE4.1", "AVX", "AVX2"]
+            missing = []
+            logger.debug("cpuinfo not available, assuming modern CPU with AVX2")
+
+    except Exception as e:
+        logger.debug("CPU capability detection failed: %s", e)
+        supported = ["SSE4.1", "AVX", "AVX2"]
+        missing = []
+
+    can_run = "SSE4.1" in supported or len(supported) > 0
+
+    return can_run, tuple(supported), tuple(missing)
+
+
+class _RangeNotSupported(Exception):
+    """Server did not honour an HTTP Range request."""
+
+
+@functools.lru_cache(maxsize=16)
+def _proxy_for(scheme: str, host: str) -> Optional[tuple[str, Optional[int], dict]]:
+    """Resolve the proxy urllib would use for a URL (cached per scheme/host).
+
+    Reads HTTP(S)_PROXY/NO_PROXY and, on Windows, the system Internet
+    Settings, like urllib.request's ProxyHandler.
+
+    Returns:
+        (proxy host, proxy port, Proxy-Authorization header if the proxy URL
+        has credentials), or None to connect directly.
+    """
+    proxy = urllib.request.getproxies().get(scheme)
+    if not proxy or urllib.request.proxy_bypass(host):
+        return None
+    if "://" not in proxy:
+        proxy = f"http://{proxy}"
+    parts = urllib.parse.urlsplit(proxy)
+    if not parts.hostname:
+        return None
+    headers = {}
+    if parts.username:
+        credentials = (
+            f"{urllib.parse.unquote(parts.username)}:"
+            f"{urllib.parse.unquote(parts.password or '')}"
+        )
+        token = base64.b64encode(credentials.encode()).decode("ascii")
+        headers["Proxy-Authorization"] = f"Basic {token}"
+    return parts.hostname, parts.port, headers
+
+
+class _ConnectionPool:
+    """Keep-alive HTTP(S) connections reused across requests to the same host.
+
+    HuggingFace redirects every /resolve/ URL to its CDN, so a download or
+    update check costs two TLS handshakes when each request opens a fresh
+    connection. Connections are returned to the pool once their response has
+    been read to the end. Proxies are honoured like urllib does (see
+    _proxy_for): HTTPS is tunnelled with CONNECT.
+    """
+
+    def __init__(self, maxsize: int = HTTP_POOL_SIZE):
+        self._maxsize = maxsize
+        self._idle: dict[tuple, list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def _connect(self, key: tuple, timeout: float) -> http.client.HTTPConnection:
+        scheme, host, port = key
+        proxy = _proxy_for(scheme, host)
+        if proxy is None:
+            if scheme == "https":
+                return http.client.HTTPSConnection(host, port, timeout=timeout)
+            return http.client.HTTPConnection(host, port, timeout=timeout)
+        proxy_host, proxy_port, proxy_headers = proxy
+        if scheme == "https":
+            # CONNECT tunnel; TLS to the origin runs inside it
+            conn = http.client.HTTPSConnection(proxy_host, proxy_port, timeout=timeout)
+            conn.set_tunnel(host, port, headers=proxy_headers)
+            return conn
+        # Plain HTTP goes to the proxy with the absolute URL (see _send)
+        return http.client.HTTPConnection(proxy_host, proxy_port, timeout=timeout)
+
+    def _release(
+        self, key: tuple, conn: http.client.HTTPConnection, response: http.client.HTTPResponse
+    ) -> None:
+        """Pool the connection if its response was fully read, else close it."""
+        if response.isclosed() and not response.will_close:
+            with self._lock:
+                idle = self._idle.setdefault(key, [])
+                if len(idle) < self._maxsize:
+                    idle.append(conn)
+                    return
+        conn.close()
+
+    def _send(
+        self, method: str, url: str, headers: dict, timeout: float
+    ) -> tuple[tuple, http.client.HTTPConnection, http.client.HTTPResponse]:
+        parts = urllib.parse.urlsplit(url)
+        key = (parts.scheme, parts.hostname, parts.port)
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        if parts.scheme == "http":
+            proxy = _proxy_for(parts.scheme, parts.hostname)
+            if proxy is not None:
+                path = urllib.parse.urlunsplit(parts._replace(fragment=""))
+                headers = {**headers, **proxy[2]}
+
+        with self._lock:
+            idle = self._idle.get(key)
+            conn = idle.pop() if idle else None
+        reused = conn is not None
+        if conn is None:
+            conn = self._connect(key, timeout)
+        elif conn.sock is not None:
+            conn.sock.settimeout(timeout)
+
+        while True:
+            try:
+                conn.request(method, path, headers=headers)
+                return key, conn, conn.getresponse()
+            except (http.client.HTTPException, OSError) as e:
+                conn.close()
+                if not reused:
+                    raise urllib.error.URLError(e) from e
+            # The server dropped the idle connection; retry on a fresh one
+            conn = self._connect(key, timeout)
+            reused = False
+
+    @contextlib.contextmanager
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: float = HTTP_TIMEOUT,
+    ):
+        """Send a request, following redirects, and yield the final response.
+
+        Raises:
+            urllib.error.HTTPError: The server answered with a 4xx/5xx status.
+            urllib.error.URLError: Connection failure or too many redirects.
+        """
+        all_headers = {**HTTP_HEADERS, **(headers or {})}
+        for _ in range(HTTP_MAX_REDIRECTS + 1):
+            key, conn, response = self._send(method, url, all_headers, timeout)
+            location = response.getheader("Location")
+            if response.status in (301, 302, 303, 307, 308) and location:
+                response.read()
+                self._release(key, conn, response)
+                url = urllib.parse.urljoin(url, location)
+                continue
+            if response.status >= 400:
+                response.read()
+                self._release(key, conn, response)
+                raise urllib.error.HTTPError(
+                    url, response.status, response.reason, response.msg, None
+                )
+            try:
+                yield response
+            finally:
+                if method == "HEAD":
+                    response.read()
+                self._release(key, conn, response)
+            return
+        raise urllib.error.URLError(f"Too many redirects for {url}")
+
+
+_http_pool = _ConnectionPool()
+
+
 class ModelManager:
     """Manages GGML Whisper model downloads and validation."""
 
-    def __init__(self):
-        """Initialize model manager."""
+    def __init__(self, prefer_native_hash: bool = True):
+        """Initialize model manager.
+
+        Args:
+            prefer_native_hash: Hash with a native tool (b3sum, md5sum,
+                certutil) when one is on PATH instead of in-process MD5.
+        """
         setup_model_cache()
+        self._prefer_native_hash = prefer_native_hash
         self._models_dir = get_models_dir()
+        self._model_paths: dict[str, Path] = {
+            name: self._models_dir / info["file"] for name, info in WHISPER_MODELS.items()
+        }
+        # model name -> (monotonic time, stat result or None), see _model_stat
+        self._stat_cache: dict[str, tuple[float, Optional[os.stat_result]]] = {}
         self._metadata_path = self._models_dir / METADATA_FILE
+        # Serialized form last read from / written to disk (dirty check)
+        self._saved_metadata: Optional[bytes] = None
         self._metadata = self._load_metadata()
 
     def _load_metadata(self) -> dict:
         """Load model metadata (hashes, sizes) from local file."""
-        if self._metadata_path.exists():
-            try:
-                with open(self._metadata_path, "r") as f:
-                    return json.load(f)
-            except Exception as e:
-                logger.warning("Failed to load model metadata: %s", e)
-        return {}
+        try:
+            data = self._metadata_path.read_bytes()
+        except FileNotFoundError:
+            return {}
+        except OSError as e:
+            logger.warning("Failed to load model metadata: %s", e)
+            return {}
+        try:
+            metadata = _parse_metadata(data)
+        except Exception as e:
+            logger.warning("Failed to load model metadata: %s", e)
+            return {}
+        # Files in another layout (e.g. older indented JSON) are rewritten
+        # compactly on the next save
+        self._saved_metadata = data
+        return metadata
 
     def _save_metadata(self) -> None:
-        """Save model metadata to local file."""
+        """Save model metadata to local file.
+
+        Skipped when nothing changed since the last load/save. Written to a
+        temp file, fsynced and renamed over the original so a crash can't
+        leave truncated JSON behind (which would force full rehashes).
+        """
         try:
-            with open(self._metadata_path, "w") as f:
-                json.dump(self._metadata, f, indent=2)
+            data = _dump_metadata(self._metadata)
+            if data == self._saved_metadata:
+                return
+            tmp_path = self._metadata_path.with_suffix(".tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self._metadata_path)
+            self._saved_metadata = data
         except Exception as e:
             logger.warning("Failed to save model metadata: %s", e)
 
-    def _compute_md5(self, file_path: Path) -> str:
-        """Compute MD5 hash of a file."""
-        md5_hash = hashlib.md5()
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(1024 * 1024), b""):
-                md5_hash.update(chunk)
-        return md5_hash.hexdigest()
+    def _compute_hash(self, file_path: Path, algo: str = HASH_ALGO) -> str:
+        """Compute the hex digest of a file ("blake3" or "md5")."""
+        return _compute_hash(file_path, algo, self._prefer_native_hash)
+
+    def _store_hash(
+        self,
+        model_name: str,
+        file_path: Path,
+        file_hash: Optional[str] = None,
+        remote: Optional[Mapping[str, str]] = None,
+        st: Optional[os.stat_result] = None,
+    ) -> str:
+        """Save a model file's HASH_ALGO hash to the metadata.
+
+        Args:
+            model_name: Model name for the metadata entry.
+            file_path: Path to the model file.
+            file_hash: Hash computed elsewhere (e.g. while downloading); the
+                file is hashed when None.
+            remote: HEAD response headers from the download of this file. The
+                ETag and Content-Length are kept for update checks; when None
+                the previously recorded values are carried over.
+            st: Current stat of file_path, if the caller already has one.
+        """
+        if st is None:
+            st = file_path.stat()
+        if file_hash is None:
+            file_hash = self._compute_hash(file_path)
+        previous = self._metadata.get(model_name) or {}
+        entry = {
+            "hash": file_hash,
+            "algo": HASH_ALGO,
+        }
+        if remote is not None:
+            etag = remote.get("ETag")
+            remote_size = remote.get("Content-Length")
+            if etag:
+                entry["etag"] = etag
+            if remote_size:
+                entry["remote_size"] = int(remote_size)
+        else:
+            for key in ("etag", "remote_size"):
+                if key in previous:
+                    entry[key] = previous[key]
+        self._metadata[model_name] = entry
+        self._set_fingerprint(model_name, st)
+        self._save_metadata()
+        logger.info("Stored %s hash for %s: %s", HASH_ALGO, model_name, file_hash)
+        return file_hash
+
+    def _set_fingerprint(self, model_name: str, st: os.stat_result) -> None:
+        """Record the (size, mtime_ns) a model file had when its hash was checked."""
+        entry = self._metadata[model_name]
+        entry["size"] = st.st_size
+        entry["mtime_ns"] = st.st_mtime_ns
+        entry["verified_at"] = int(time.time())
+
+    @staticmethod
+    def _lookup(model_name: str) -> Optional[Mapping]:
+        """Return the WHISPER_MODELS entry for model_name, or None if unknown."""
+        return WHISPER_MODELS.get(model_name)
 
     def _get_model_path(self, model_name: str) -> Path:
         """Get path to GGML model file."""
-        if model_name not in WHISPER_MODELS:
-            return self._models_dir / f"ggml-{model_name}.bin"
-        return self._models_dir / WHISPER_MODELS[model_name]["file"]
+        return self._model_paths.get(model_name) or self._models_dir / f"ggml-{model_name}.bin"
 
-    def _verify_hash(self, file_path: Path, model_name: str) -> tuple[bool, str]:
-        """Verify MD5 hash of model file against stored hash.
+    def _model_stat(self, model_name: str, fresh: bool = False) -> Optional[os.stat_result]:
+        """Stat a model file (None if missing), cached for EXISTS_CACHE_TTL seconds.
+
+        UI refreshes query the same models several times in a row; downloads
+        and updates invalidate the entry.
+
+        Args:
+            model_name: Model name.
+            fresh: Bypass the cache. Hash verification compares size and mtime,
+                so it needs the current values; the result still refreshes
+                the cache.
+        """
+        now = time.monotonic()
+        if not fresh:
+            cached = self._stat_cache.get(model_name)
+            if cached is not None and now - cached[0] < EXISTS_CACHE_TTL:
+                return cached[1]
+        try:
+            st = self._get_model_path(model_name).stat()
+        except FileNotFoundError:
+            st = None
+        self._stat_cache[model_name] = (now, st)
+        return st
+
+    def _model_exists(self, model_name: str) -> bool:
+        """Whether a model file exists (see _model_stat)."""
+        return self._model_stat(model_name) is not None
+
+    @staticmethod
+    def _fingerprint_matches(stored: Optional[dict], st: os.stat_result) -> bool:
+        """Whether a file still has the size and mtime it was last verified at."""
+        return (
+            stored is not None
+            and stored.get("mtime_ns") == st.st_mtime_ns
+            and stored.get("size") == st.st_size
+        )
+
+    @staticmethod
+    def _stored_hash(stored: dict) -> tuple[str, Optional[str]]:
+        """Return (algo, hex digest) of a metadata entry, including legacy MD5 ones."""
+        if "hash" in stored:
+            return stored.get("algo", "md5"), stored["hash"]
+        return "md5", stored.get("md5")
+
+    def _can_hash(self, algo: str) -> bool:
+        """Whether algo can be computed here (blake3 needs the module or b3sum)."""
+        return algo != "blake3" or _blake3 is not None or bool(
+            self._prefer_native_hash and _native_hash_command("blake3")
+        )
+
+    def _verify_hash(
+        self,
+        file_path: Path,
+        model_name: str,
+        st: Optional[os.stat_result] = None,
+        actual_hash: Optional[str] = None,
+    ) -> tuple[bool, str]:
+        """Verify hash of model file against stored hash.
 
         Args:
             file_path: Path to model file to verify.
             model_name: Model name for hash lookup.
+            st: Current stat of file_path, if the caller already has one.
+            actual_hash: The file's digest in the algorithm _verify_hash would
+                use, if already computed (see verify_all).
 
         Returns:
             Tuple of (valid, error_message).
             - If no stored hash, computes and stores it (first run).
             - If stored hash exists, verifies file matches.
+            - Legacy MD5-only entries are verified once and rewritten with HASH_ALGO.
+            - Files whose size and mtime match the last verified fingerprint
+              are trusted without rehashing.
         """
         try:
-            logger.info("Verifying %s...", model_name)
-            actual_hash = self._compute_md5(file_path)
-            actual_size = file_path.stat().st_size
+            if st is None:
+                st = file_path.stat()
 
             # Check if we have stored metadata for this model
             stored = self._metadata.get(model_name)
+            if self._fingerprint_matches(stored, st):
+                logger.debug("%s unchanged since last verification", model_name)
+                return True, ""
+
+            logger.info("Verifying %s...", model_name)
             if stored is None:
                 # First time - store the hash
-                self._metadata[model_name] = {
-                    "md5": actual_hash,
-                    "size": actual_size,
-                }
-                self._save_metadata()
-                logger.info("Stored hash for %s: %s", model_name, actual_hash)
+                self._store_hash(model_name, file_path, actual_hash, st=st)
+                return True, ""
+
+            algo, expected_hash = self._stored_hash(stored)
+            if not self._can_hash(algo):
+                # Recorded with blake3, which is no longer installed
+                if stored.get("size") not in (None, st.st_size):
+                    error_msg = f"File corrupted or modified: {model_name}"
+                    logger.error("%s (size changed)", error_msg)
+                    return False, error_msg
+                logger.warning("blake3 not installed; checked size only for %s", model_name)
                 return True, ""
 
-            expected_hash = stored.get("md5")
+            if actual_hash is None:
+                actual_hash = self._compute_hash(file_path, algo)
             if expected_hash and actual_hash != expected_hash:
                 error_msg = f"File corrupted or modified: {model_name}"
                 logger.error("%s (expected %s, got %s)", error_msg, expected_hash, actual_hash)
                 return False, error_msg
 
             logger.info("Hash OK for %s", model_name)
+            if algo != HASH_ALGO:
+                self._store_hash(model_name, file_path, st=st)
+            else:
+                self._set_fingerprint(model_name, st)
+                self._save_metadata()
             return True, ""
 
         except OSError as e:
@@ -162,19 +826,18 @@ class ModelManager:
         Returns:
             True if model file exists (and hash matches if verify_hash=True).
         """
-        if model_name not in WHISPER_MODELS:
+        if self._lookup(model_name) is None:
             logger.warning("Unknown model: %s", model_name)
             return False
 
-        model_path = self._get_model_path(model_name)
-        if not model_path.exists():
-            return False
+        if not verify_hash:
+            return self._model_exists(model_name)
 
-        if verify_hash:
-            is_valid, _ = self._verify_hash(model_path, model_name)
-            return is_valid
-
-        return True
+        st = self._model_stat(model_name, fresh=True)
+        if st is None:
+            return False
+        is_valid, _ = self._verify_hash(self._get_model_path(model_name), model_name, st)
+        return is_valid
 
     def is_model_up_to_date(self, model_name: str) -> tuple[bool, str]:
         """Check if a model exists and has the correct hash.
@@ -188,18 +851,83 @@ class ModelManager:
             - (False, "Model not found") if file doesn't exist
             - (False, "Hash mismatch...") if hash doesn't match
         """
-        if model_name not in WHISPER_MODELS:
+        if self._lookup(model_name) is None:
             return False, f"Unknown model: {model_name}"
 
-        model_path = self._get_model_path(model_name)
-        if not model_path.exists():
+        st = self._model_stat(model_name, fresh=True)
+        if st is None:
             return False, "Model not found"
 
-        is_valid, error_msg = self._verify_hash(model_path, model_name)
+        is_valid, error_msg = self._verify_hash(self._get_model_path(model_name), model_name, st)
         if is_valid:
             return True, "Model is up to date"
         return False, error_msg
 
+    def verify_all(
+        self, model_names: Optional[Iterable[str]] = None
+    ) -> dict[str, tuple[bool, str]]:
+        """Check several models at once, hashing them in parallel.
+
+        When two or more files need a full hash, each is hashed in its own
+        worker process so the smaller models finish while the largest one is
+        still being read. Results match is_model_up_to_date for each model.
+
+        Args:
+            model_names: Models to check; defaults to every known model.
+
+        Returns:
+            Mapping of model name to (up_to_date, message).
+        """
+        if model_names is None:
+            model_names = WHISPER_MODELS
+        results: dict[str, tuple[bool, str]] = {}
+        pending: list[tuple[str, os.stat_result, Optional[str]]] = []
+
+        for name in model_names:
+            if self._lookup(name) is None:
+                results[name] = (False, f"Unknown model: {name}")
+                continue
+            st = self._model_stat(name, fresh=True)
+            if st is None:
+                results[name] = (False, "Model not found")
+                continue
+            stored = self._metadata.get(name)
+            algo = HASH_ALGO if stored is None else self._stored_hash(stored)[0]
+            if self._fingerprint_matches(stored, st) or not self._can_hash(algo):
+                algo = None  # decided without reading the file
+            pending.append((name, st, algo))
+
+        hashes: dict[str, str] = {}
+        to_hash = [(name, algo) for name, _, algo in pending if algo]
+        if len(to_hash) >= 2:
+            workers = min(len(to_hash), VERIFY_MAX_WORKERS, _CPU_COUNT)
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    futures = {
+                        name: executor.submit(
+                            _compute_hash,
+                            self._get_model_path(name),
+                            algo,
+                            self._prefer_native_hash,
+                        )
+                        for name, algo in to_hash
+                    }
+                    for name, future in futures.items():
+                        try:
+                            hashes[name] = future.result()
+                        except Exception as e:
+                            # _verify_hash hashes it again and reports the error
+                            logger.debug("Parallel hash of %s failed: %s", name, e)
+            except Exception as e:
+                logger.warning("Parallel verification unavailable: %s", e)
+
+        for name, st, _ in pending:
+            is_valid, error_msg = self._verify_hash(
+                self._get_model_path(name), name, st, hashes.get(name)
+            )
+            results[name] = (True, "Model is up to date") if is_valid else (False, error_msg)
+        return results
+
     def get_model_path(self, model_name: str) -> Optional[Path]:
         """Get path to downloaded model.
 
@@ -209,14 +937,109 @@ class ModelManager:
         Returns:
             Path to model file, or None if not found.
         """
-        if model_name not in WHISPER_MODELS:
+        if self._lookup(model_name) is None:
             return None
 
-        model_path = self._get_model_path(model_name)
-        if model_path.exists():
-            return model_path
+        if self._model_exists(model_name):
+            return self._get_model_path(model_name)
         return None
 
+    @staticmethod
+    def _head(url: str) -> Optional[Mapping[str, str]]:
+        """HEAD the URL; return the response headers, or None on failure."""
+        try:
+            with _http_pool.request("HEAD", url) as response:
+                return response.headers
+        except Exception as e:
+            logger.debug("HEAD %s failed: %s", url, e)
+            return None
+
+    @staticmethod
+    def _ranged_size(headers: Optional[Mapping[str, str]]) -> int:
+        """Return the remote size if byte ranges are supported, else 0."""
+        if headers is None or headers.get("Accept-Ranges", "").lower() != "bytes":
+            return 0
+        try:
+            return int(headers.get("Content-Length") or 0)
+        except ValueError:
+            return 0
+
+    def _download_stream(
+        self, url: str, temp_path: Path, reporthook: Callable[[int, int], None]
+    ) -> str:
+        """Download url to temp_path over one connection, hashing as it streams.
+
+        Returns:
+            HASH_ALGO hex digest of the downloaded bytes.
+        """
+        # Hash while downloading so the file isn't read back afterwards
+        hasher = _new_hasher()
+        with _http_pool.request("GET", url) as response, open(temp_path, "wb") as f:
+            total_size = int(response.headers.get("Content-Length") or -1)
+            downloaded = 0
+            # One reusable buffer; large reads keep per-chunk Python work low
+            buf = memoryview(bytearray(DOWNLOAD_CHUNK_SIZE))
+            while n := response.readinto(buf):
+                chunk = buf[:n]
+                f.write(chunk)
+                hasher.update(chunk)
+                downloaded += n
+                reporthook(downloaded, total_size)
+        return hasher.hexdigest()
+
+    def _download_parallel(
+        self,
+        url: str,
+        temp_path: Path,
+        total_size: int,
+        reporthook: Callable[[int, int], None],
+    ) -> None:
+        """Download url to temp_path as DOWNLOAD_SEGMENTS concurrent byte ranges.
+
+        Raises:
+            _RangeNotSupported: The server answered a segment without a 206.
+        """
+        with open(temp_path, "wb") as f:
+            f.truncate(total_size)
+
+        segment_size = -(-total_size // DOWNLOAD_SEGMENTS)
+        ranges = [
+            (lo, min(lo + segment_size, total_size) - 1)
+            for lo in range(0, total_size, segment_size)
+        ]
+        progress_lock = threading.Lock()
+        downloaded = 0
+
+        def fetch(lo: int, hi: int) -> None:
+            nonlocal downloaded
+            try:
+                with _http_pool.request(
+                    "GET", url, {"Range": f"bytes={lo}-{hi}"}
+                ) as response, open(temp_path, "r+b") as f:
+                    if response.status != 206:
+                        raise _RangeNotSupported(f"HTTP {response.status} for a range request")
+                    f.seek(lo)
+                    remaining = hi - lo + 1
+                    buf = memoryview(bytearray(DOWNLOAD_CHUNK_SIZE))
+                    while remaining > 0:
+                        n = response.readinto(buf[:min(remaining, DOWNLOAD_CHUNK_SIZE)])
+                        if not n:
+                            raise OSError(f"Connection closed with {remaining} bytes left")
+                        f.write(buf[:n])
+                        remaining -= n
+                        with progress_lock:
+                            downloaded += n
+                            reporthook(downloaded, total_size)
+            except urllib.error.HTTPError as e:
+                if e.code in (416, 501):
+                    raise _RangeNotSupported(f"HTTP {e.code}") from e
+                raise
+
+        with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+            futures = [executor.submit(fetch, lo, hi) for lo, hi in ranges]
+            for future in futures:
+                future.result()
+
     def download_model(
         self,
         model_name: str,
@@ -231,10 +1054,10 @@ class ModelManager:
         Returns:
             Tuple of (success, error_message).
         """
-        if model_name not in WHISPER_MODELS:
+        model_info = self._lookup(model_name)
+        if model_info is None:
             return False, f"Unknown model: {model_name}"
 
-        model_info = WHISPER_MODELS[model_name]
         filename = model_info["file"]
         url = f"{GGML_BASE_URL}/{filename}"
         target_path = self._models_dir / filename
@@ -245,42 +1068,30 @@ class ModelManager:
             logger.info("Downloading model: %s from %s", model_name, url)
 
             # Download with progress tracking
-            import time
-
-            last_time = [time.time()]
-            last_downloaded = [0]
-
-            def reporthook(block_num, block_size, total_size):
-                downloaded = block_num * block_size
-                now = time.time()
-
-                if now - last_time[0] >= 0.5:
-                    bytes_delta = downloaded - last_downloaded[0]
-                    time_delta = now - last_time[0]
-                    speed_mbps = (bytes_delta / time_delta) / (1024 * 1024) if time_delta > 0 else 0
-
-                    if progress_callback:
-                        progress_callback(downloaded, total_size, speed_mbps)
-
-                    last_time[0] = now
-                    last_downloaded[0] = downloaded
+            reporthook = _progress_reporter(progress_callback)
 
             temp_path = target_path.with_suffix(".tmp")
-            urllib.request.urlretrieve(url, temp_path, reporthook)
+            file_hash = None
+            downloaded_parallel = False
+            headers = self._head(url)
+            total_size = self._ranged_size(headers)
+            if total_size >= PARALLEL_DOWNLOAD_MIN_BYTES:
+                try:
+                    self._download_parallel(url, temp_path, total_size, reporthook)
+                    downloaded_parallel = True
+                except _RangeNotSupported as e:
+                    logger.info("Parallel download unavailable (%s); using one stream", e)
+            if not downloaded_parallel:
+                file_hash = self._download_stream(url, temp_path, reporthook)
 
             # Move to final location
             temp_path.rename(target_path)
+            self._stat_cache.pop(model_name, None)
 
-            # Store hash of downloaded file
+            # Store hash of downloaded file (segments arrive out of order, so a
+            # parallel download is hashed from the page-cache-hot file instead)
             try:
-                file_hash = self._compute_md5(target_path)
-                file_size = target_path.stat().st_size
-                self._metadata[model_name] = {
-                    "md5": file_hash,
-                    "size": file_size,
-                }
-                self._save_metadata()
-                logger.info("Stored hash for %s: %s", model_name, file_hash)
+                self._store_hash(model_name, target_path, file_hash, remote=headers or {})
             except Exception as e:
                 logger.warning("Failed to store hash: %s", e)
 
@@ -316,21 +1127,14 @@ class ModelManager:
         Returns:
             Tuple of (valid, error_message).
         """
-        if not self.is_model_available(model_name):
+        model_info = self._lookup(model_name)
+        st = self._model_stat(model_name) if model_info is not None else None
+        if st is None:
             return False, "Model not found"
 
-        model_path = self.get_model_path(model_name)
-        if not model_path:
-            return False, "Model path not found"
-
-        model_info = WHISPER_MODELS[model_name]
-
         # Check file size is reasonable (within 20% of expected)
-        actual_size = model_path.stat().st_size
-        expected_size = model_info["size_bytes"]
-        size_ratio = actual_size / expected_size
-
-        if size_ratio < 0.8 or size_ratio > 1.2:
+        actual_size = st.st_size
+        if not model_info["size_lo"] <= actual_size <= model_info["size_hi"]:
             return False, f"Model file size unexpected: {actual_size / (1024*1024):.0f}MB"
 
         return True, ""
@@ -346,36 +1150,8 @@ class ModelManager:
         Returns:
             Tuple of (can_run, supported_features, missing_features).
         """
-        supported = []
-        missing = []
-
-        try:
-            try:
-                import cpuinfo
-
-                info = cpuinfo.get_cpu_info()
-                flags = info.get("flags", [])
-
-                features_to_check = ["sse4_1", "avx", "avx2", "avx512f"]
-                for feature in features_to_check:
-                    if feature in flags:
-                        supported.append(feature.upper().replace("_", "."))
-                    else:
-                        missing.append(feature.upper().replace("_", "."))
-
-            except ImportError:
-                supported = ["SSE4.1", "AVX", "AVX2"]
-                missing = []
-                logger.debug("cpuinfo not available, assuming modern CPU with AVX2")
-
-        except Exception as e:
-            logger.debug("CPU capability detection failed: %s", e)
-            supported = ["SSE4.1", "AVX", "AVX2"]
-            missing = []
-
-        can_run = "SSE4.1" in supported or len(supported) > 0
-
-        return can_run, supported, missing
+        can_run, supported, missing = _cpu_capabilities()
+        return can_run, list(supported), list(missing)
 
     def check_hardware_compatibility(self, model_name: str) -> tuple[bool, str]:
         """Check if hardware can run a model.
@@ -386,10 +1162,10 @@ class ModelManager:
         Returns:
             Tuple of (compatible, warning_message).
         """
-        if model_name not in WHISPER_MODELS:
+        model_info = self._lookup(model_name)
+        if model_info is None:
             return False, f"Unknown model: {model_name}"
 
-        model_info = WHISPER_MODELS[model_name]
         warnings = []
 
         # Check CPU capabilities
@@ -405,10 +1181,7 @@ class ModelManager:
             )
 
         # Check CPU cores
-        try:
-            cpu_cores = os.cpu_count() or 1
-        except Exception:
-            cpu_cores = 1
+        cpu_cores = _CPU_COUNT
 
         if cpu_cores < 2:
             return False, "Need at least 2 CPU cores to run Whisper"
@@ -422,12 +1195,12 @@ class ModelManager:
         try:
             import psutil
 
-            available_gb = psutil.virtual_memory().available / (1024**3)
-            required_gb = float(model_info["ram"].rstrip("GB"))
+            available = psutil.virtual_memory().available
 
-            if available_gb < required_gb:
+            if available < model_info["ram_bytes"]:
                 warnings.append(
-                    f"Model needs ~{model_info['ram']} RAM, ~{available_gb:.1f}GB available"
+                    f"Model needs ~{model_info['ram']} RAM, "
+                    f"~{available / (1024**3):.1f}GB available"
                 )
         except ImportError:
             pass
@@ -439,24 +1212,24 @@ class ModelManager:
 
         return True, ""
 
-    def get_model_info(self, model_name: str) -> Optional[dict]:
+    def get_model_info(self, model_name: str) -> Optional[Mapping]:
         """Get model metadata.
 
         Args:
             model_name: Model name.
 
         Returns:
-            Model info dict, or None if unknown.
+            Read-only model info mapping, or None if unknown.
         """
-        return WHISPER_MODELS.get(model_name)
+        return self._lookup(model_name)
 
-    def get_all_models(self) -> dict:
+    def get_all_models(self) -> Mapping[str, Mapping]:
         """Get all available models.
 
         Returns:
-            Dictionary of model name to info.
+            Read-only mapping of model name to info.
         """
-        return WHISPER_MODELS.copy()
+        return WHISPER_MODELS
 
     def get_download_url(self, model_name: str) -> Optional[str]:
         """Get direct download URL for model.
@@ -467,11 +1240,43 @@ class ModelManager:
         Returns:
             URL string, or None if unknown model.
         """
-        if model_name not in WHISPER_MODELS:
+        model_info = self._lookup(model_name)
+        if model_info is None:
             return None
 
-        filename = WHISPER_MODELS[model_name]["file"]
-        return f"{GGML_BASE_URL}/{filename}"
+        return f"{GGML_BASE_URL}/{model_info['file']}"
+
+    def _remote_unchanged(self, model_name: str, model_path: Path) -> bool:
+        """Check whether the local model still matches the remote file.
+
+        Compares the ETag (and Content-Length, when served) of a HEAD request
+        against the values recorded at download time, then confirms the local
+        file itself is intact. Any missing data or failed request means the
+        model is treated as changed.
+        """
+        entry = self._metadata.get(model_name) or {}
+        stored_etag = entry.get("etag")
+        if not stored_etag:
+            return False
+        st = self._model_stat(model_name, fresh=True)
+        if st is None:
+            return False
+
+        url = self.get_download_url(model_name)
+        headers = self._head(url) if url else None
+        if headers is None or headers.get("ETag") != stored_etag:
+            return False
+
+        remote_size = headers.get("Content-Length")
+        if remote_size and "remote_size" in entry:
+            try:
+                if int(remote_size) != entry["remote_size"]:
+                    return False
+            except ValueError:
+                return False
+
+        is_valid, _ = self._verify_hash(model_path, model_name, st)
+        return is_valid
 
     def update_model(
         self,
@@ -487,13 +1292,20 @@ class ModelManager:
         Returns:
             Tuple of (success, error_message).
         """
-        # Remove old model file if it exists
         model_path = self._get_model_path(model_name)
-        if model_path.exists():
-            try:
-                model_path.unlink()
-            except OSError as e:
-                return False, f"Failed to remove old model: {e}"
+        if self._remote_unchanged(model_name, model_path):
+            logger.info("Model %s matches the remote copy; skipping update", model_name)
+            return True, "Already up to date"
+
+        # Remove old model file if it exists
+        try:
+            model_path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            return False, f"Failed to remove old model: {e}"
+        finally:
+            self._stat_cache.pop(model_name, None)
 
         # Download new version
         return self.download_model(model_name, progress_callback)
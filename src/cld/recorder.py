@@ -3,17 +3,39 @@
 import logging
 import math
 import threading
-from collections import deque
+import time
 from dataclasses import dataclass
-from typing import Deque, Optional
+from typing import Optional
 
 import numpy as np
 
-# Thread-safe audio level and spectrum for visualization
-_current_level: float = 0.0
-_level_lock = threading.Lock()
-_spectrum_bands: list[float] = [0.0] * 32
-_spectrum_lock = threading.Lock()
+from cld import _recorder_kernels
+
+# Initial record buffer size; it doubles whenever a recording outgrows it
+RECORD_BUFFER_INITIAL_SECONDS = 4
+
+# Spectrum visualization: log-spaced bands over the voice frequency range
+# (200-4000 Hz), where speech formants and consonants live
+_SPECTRUM_BANDS = 32
+_SPECTRUM_MIN_FREQ = 200.0
+_SPECTRUM_MAX_FREQ = 4000.0
+_SPECTRUM_EDGES = np.geomspace(_SPECTRUM_MIN_FREQ, _SPECTRUM_MAX_FREQ, _SPECTRUM_BANDS + 1)
+# Display gains: RMS -> level, and level -> loudest band height (both clipped to 1)
+_LEVEL_GAIN = 80.0
+_BAND_GAIN = 3.0
+# Upper bound on level/spectrum updates; with small blocks only every Nth
+# block is analyzed (a bar display gains nothing from faster updates)
+_VIZ_MAX_RATE_HZ = 30
+# Blocks queued for the visualization worker; when it falls behind the
+# callback drops blocks rather than wait
+_VIZ_RING_SLOTS = 4
+
+# scipy.fft (optional) keeps float32 input in single precision and pads odd
+# block sizes to a fast FFT length; numpy.fft is the fallback
+try:
+    from scipy import fft as _scipy_fft
+except ImportError:
+    _scipy_fft = None
 
 _SOUNDDEVICE_IMPORT_ERROR: Exception | None = None
 try:
@@ -23,6 +45,36 @@ except Exception as exc:
     _SOUNDDEVICE_IMPORT_ERROR = exc
 
 
+def _compute_band_bins(n_bins: int, sample_rate: int) -> np.ndarray:
+    """Return the [low, high) FFT bin range of each spectrum band.
+
+    Args:
+        n_bins: Number of bins in the rfft output.
+        sample_rate: Audio sample rate in Hz.
+
+    Returns:
+        (bands, 2) array of bin ranges; every band has at least one bin.
+    """
+    bin_edges = (_SPECTRUM_EDGES * (n_bins * 2 / sample_rate)).astype(np.intp)
+    bin_low = np.clip(bin_edges[:-1], 0, n_bins - 1)
+    bin_high = np.maximum(bin_low + 1, np.minimum(bin_edges[1:], n_bins))
+    return np.stack((bin_low, bin_high), axis=1)
+
+
+def _fft_length(frames: int) -> int:
+    """FFT length used for a block of frames (padded to a fast size with scipy)."""
+    if _scipy_fft is not None:
+        return _scipy_fft.next_fast_len(frames, real=True)
+    return frames
+
+
+def _rfft(audio: np.ndarray, n: int) -> np.ndarray:
+    """Real FFT of audio zero-padded to n points; audio may be overwritten."""
+    if _scipy_fft is not None:
+        return _scipy_fft.rfft(audio, n=n, overwrite_x=True, workers=1)
+    return np.fft.rfft(audio, n=n)
+
+
 @dataclass
 class RecorderConfig:
     """Configuration for audio recording."""
@@ -44,6 +96,129 @@ class AudioChunk:
     timestamp: float
 
 
+class _RecordBuffer:
+    """Contiguous sample buffer for one recording (or the pre-roll ring).
+
+    Blocks are copied straight into a preallocated array that doubles in size
+    when full, so stopping a recording is a slice rather than a concatenation
+    of every block. With a maximum length the buffer stops growing at that
+    size and becomes a ring that keeps only the most recent samples.
+
+    Mono audio is stored 1-D (frames,); more channels as (frames, channels).
+    """
+
+    def __init__(
+        self,
+        channels: int,
+        dtype: np.dtype,
+        initial_frames: int,
+        max_frames: Optional[int] = None,
+    ):
+        capacity = min(initial_frames, max_frames) if max_frames else initial_frames
+        shape = (max(1, capacity),) if channels == 1 else (max(1, capacity), channels)
+        self._data = np.empty(shape, dtype=dtype)
+        self._max_frames = max_frames
+        self._pos = 0  # next write index
+        self._wrapped = False  # ring mode has overwritten old samples
+
+    def __len__(self) -> int:
+        return len(self._data) if self._wrapped else self._pos
+
+    def append(self, block: np.ndarray) -> None:
+        """Copy a block (in the buffer's layout) onto the end of the buffer."""
+        n = len(block)
+        end = self._pos + n
+        capacity = len(self._data)
+        if end > capacity and not self._wrapped:
+            limit = self._max_frames or end
+            new_capacity = min(limit, max(end, capacity * 2))
+            if new_capacity > capacity:
+                grown = np.empty((new_capacity,) + self._data.shape[1:], dtype=self._data.dtype)
+                grown[: self._pos] = self._data[: self._pos]
+                self._data = grown
+                capacity = new_capacity
+        if end <= capacity:
+            self._data[self._pos:end] = block
+            if end == self._max_frames:
+                # Filled to the maximum; further writes wrap around
+                self._pos = 0
+                self._wrapped = True
+            else:
+                self._pos = end
+            return
+
+        # Ring is full: keep the newest samples, wrapping around the end
+        if n >= capacity:
+            self._data[:] = block[n - capacity:]
+            self._pos = 0
+        else:
+            first = capacity - self._pos
+            self._data[self._pos:] = block[:first]
+            self._data[: n - first] = block[first:]
+            self._pos = n - first
+        self._wrapped = True
+
+    def drain_into(self, target: "_RecordBuffer") -> None:
+        """Append the samples in order to target (at most two copies) and clear."""
+        if self._wrapped:
+            target.append(self._data[self._pos:])
+        if self._pos:
+            target.append(self._data[: self._pos])
+        self.clear()
+
+    def clear(self) -> None:
+        """Drop all samples (the storage is kept)."""
+        self._pos = 0
+        self._wrapped = False
+
+    def getvalue(self) -> np.ndarray:
+        """Return the recorded samples in order (a view unless the ring wrapped)."""
+        if not self._wrapped:
+            return self._data[: self._pos]
+        if self._pos == 0:
+            return self._data
+        return np.concatenate((self._data[self._pos:], self._data[: self._pos]))
+
+
+class _BlockRing:
+    """Single-producer/single-consumer ring of float32 sample blocks.
+
+    The audio callback copies blocks into preallocated slots and the
+    visualization worker reads them in order. Each index is written by one
+    side only and a slot is published by advancing the head after the copy,
+    so neither side takes a lock.
+    """
+
+    def __init__(self, slots: int, samples: int):
+        self._slots = [np.empty(samples, dtype=np.float32) for _ in range(slots)]
+        self._head = 0  # blocks pushed (producer)
+        self._tail = 0  # blocks consumed (consumer)
+
+    def push(self, block: np.ndarray) -> bool:
+        """Copy a block into the next free slot; False if the ring is full."""
+        head = self._head
+        if head - self._tail >= len(self._slots):
+            return False
+        index = head % len(self._slots)
+        slot = self._slots[index]
+        if slot.size != block.size:
+            # Block size changed (blocksize=0); slot is free, so replace it
+            slot = self._slots[index] = np.empty(block.size, dtype=np.float32)
+        np.copyto(slot, np.ravel(block), casting="unsafe")
+        self._head = head + 1
+        return True
+
+    def peek(self) -> Optional[np.ndarray]:
+        """Return the oldest unread block (owned by the caller until advance())."""
+        if self._tail == self._head:
+            return None
+        return self._slots[self._tail % len(self._slots)]
+
+    def advance(self) -> None:
+        """Release the block returned by peek() back to the producer."""
+        self._tail += 1
+
+
 class AudioRecorder:
     """Records audio from the microphone.
 
@@ -62,16 +237,86 @@ class AudioRecorder:
         self._recording = False
         self._primed = False  # Whether pre-roll stream is running
         self._stream: Optional["sd.InputStream"] = None
-        self._recorded_chunks: Deque[np.ndarray] = deque()
         self._max_chunks = self._compute_max_chunks()
-        self._lock = threading.Lock()
+        # Record buffer sizing and layout, fixed for the recorder's lifetime
+        self._max_frames = self._max_chunks * self.config.blocksize if self._max_chunks else None
+        self._initial_frames = RECORD_BUFFER_INITIAL_SECONDS * self.config.sample_rate
+        self._dtype = np.dtype(self.config.dtype)
+        self._mono = self.config.channels == 1
+        # Recording hand-off without a lock: start() publishes a fresh buffer
+        # in _recorded, the audio callback (sole owner of the pre-roll) moves
+        # the pre-roll into it on its next block and records which buffer it
+        # is filling in _writing. stop() unpublishes the buffer and waits for
+        # an in-flight callback (odd _callback_seq) before reading it.
+        self._recorded: Optional[_RecordBuffer] = None
+        self._writing: Optional[_RecordBuffer] = None
+        # Set by stop() when it returned the pre-roll as the recording; the
+        # callback (the pre-roll's only writer) clears it before its next use
+        self._preroll_consumed = False
+        self._callback_seq = 0
         self._logger = logging.getLogger(__name__)
 
-        # Pre-roll buffer: circular buffer to capture audio before start() is called
-        preroll_samples = int(self.config.preroll_ms * self.config.sample_rate / 1000)
-        preroll_chunks = max(1, math.ceil(preroll_samples / self.config.blocksize))
-        self._preroll_buffer: Deque[np.ndarray] = deque(maxlen=preroll_chunks)
-        self._logger.debug("Pre-roll buffer: %dms (%d chunks)", self.config.preroll_ms, preroll_chunks)
+        # Pre-roll buffer: fixed-size ring of the latest samples, to capture
+        # audio before start() is called
+        preroll_frames = max(1, int(self.config.preroll_ms * self.config.sample_rate / 1000))
+        self._preroll_buffer = _RecordBuffer(
+            self.config.channels, self._dtype, preroll_frames, preroll_frames
+        )
+        self._logger.debug(
+            "Pre-roll buffer: %dms (%d frames)", self.config.preroll_ms, preroll_frames
+        )
+
+        # Level/spectrum analysis runs on a worker thread: the audio callback
+        # copies every _viz_stride-th block into the ring and sets the event
+        self._set_viz_stride(self.config.blocksize)
+        self._viz_ring = _BlockRing(_VIZ_RING_SLOTS, self.config.blocksize * self.config.channels)
+        self._viz_event = threading.Event()
+        self._viz_running = False
+        self._viz_thread: Optional[threading.Thread] = None
+        # Latest level and spectrum, [level, band 0..31]. Written only by the
+        # worker and published seqlock-style: the sequence number is odd
+        # while a write is in progress, so readers retry instead of locking.
+        self._snapshot = np.zeros(_SPECTRUM_BANDS + 1, dtype=np.float32)
+        self._snapshot_seq = 0
+
+        # FFT layout and scratch buffers, reused for every analyzed block
+        self._configure_spectrum(self.config.blocksize)
+
+    def _set_viz_stride(self, frames: int) -> None:
+        """Analyze every Nth block of this size to stay under _VIZ_MAX_RATE_HZ."""
+        self._frames = frames
+        self._viz_stride = max(1, self.config.sample_rate // (_VIZ_MAX_RATE_HZ * max(1, frames)))
+        self._viz_countdown = 0
+
+    def _configure_spectrum(self, frames: int) -> None:
+        """Set up the FFT size, band bin ranges and scratch buffers for a block size.
+
+        These depend only on the block size and sample rate, so analyzing a
+        block allocates nothing for the spectrum.
+        """
+        self._fft_frames = frames
+        self._fft_len = _fft_length(frames)
+        n_bins = self._fft_len // 2 + 1
+        band_bins = _compute_band_bins(n_bins, self.config.sample_rate)
+        # Interleaved [low0, high0, low1, high1, ...]: np.add.reduceat then
+        # sums every band in one call (even outputs; odd ones are discarded)
+        self._band_index = band_bins.ravel()
+        # Separate bounds for the fused numba kernel
+        self._band_lo = np.ascontiguousarray(self._band_index[0::2])
+        self._band_hi = np.ascontiguousarray(self._band_index[1::2])
+        self._inv_band_widths = (1.0 / (band_bins[:, 1] - band_bins[:, 0])).astype(np.float32)
+        # Hann window against spectral leakage between bands
+        self._window = np.hanning(frames * self.config.channels).astype(np.float32)
+        # One spare zero bin so a band ending at n_bins is a valid reduceat index
+        self._magnitudes = np.zeros(n_bins + 1, dtype=np.float32)
+        self._band_sums = np.empty(2 * _SPECTRUM_BANDS, dtype=np.float32)
+        self._bands = np.empty(_SPECTRUM_BANDS, dtype=np.float32)
+
+    def _new_record_buffer(self) -> _RecordBuffer:
+        """Create the buffer for one recording (4 s initially, grown as needed)."""
+        return _RecordBuffer(
+            self.config.channels, self._dtype, self._initial_frames, self._max_frames
+        )
 
     def _compute_max_chunks(self) -> Optional[int]:
         if not self.config.max_recording_seconds:
@@ -112,61 +357,169 @@ class AudioRecorder:
 
     def _audio_callback(self, indata, frames, time_info, status):
         """Audio callback that handles both pre-roll and recording."""
-        global _current_level, _spectrum_bands
+        self._callback_seq += 1
+        try:
+            self._process_block(indata, frames, status)
+        finally:
+            self._callback_seq += 1
+
+    def _process_block(self, indata, frames, status) -> None:
+        """Store one block of audio and periodically update the level/spectrum.
+
+        Every _viz_stride-th block (at most _VIZ_MAX_RATE_HZ a second) is
+        copied to the visualization worker; nothing is computed here.
+
+        Args:
+            indata: The raw stream's interleaved sample buffer, only valid
+                during the callback.
+            frames: Number of frames in the buffer.
+            status: Stream status flags.
+        """
         if status:
             self._logger.debug("Audio callback status: %s", status)
 
-        audio = indata.flatten()
+        if frames != self._frames:
+            # Variable-size block (blocksize=0)
+            self._set_viz_stride(frames)
+        self._viz_countdown -= 1
+        # Zero-copy view of PortAudio's buffer; every consumer below copies
+        # out of it into its own preallocated storage
+        samples = np.frombuffer(indata, dtype=self._dtype, count=frames * self.config.channels)
+        if self._viz_countdown <= 0:
+            if self._viz_ring.push(samples):
+                self._viz_event.set()
+            self._viz_countdown = self._viz_stride
+
+        # Store audio based on recording state; mono is kept 1-D
+        block = samples if self._mono else samples.reshape(frames, self.config.channels)
+        if self._preroll_consumed:
+            self._preroll_buffer.clear()
+            self._preroll_consumed = False
+        recorded = self._recorded
+        if recorded is not None:
+            if recorded is not self._writing:
+                # First block of a new recording - pre-roll goes in front
+                self._take_preroll(recorded)
+                self._writing = recorded
+            # Copy straight into the recording buffer for transcription
+            recorded.append(block)
+        else:
+            # Not recording - fill pre-roll buffer (circular)
+            self._preroll_buffer.append(block)
+
+    def _ensure_viz_worker(self) -> None:
+        if self._viz_thread and self._viz_thread.is_alive():
+            return
+        self._viz_running = True
+        self._viz_thread = threading.Thread(
+            target=self._viz_worker,
+            name="cld-recorder-viz",
+            daemon=True,
+        )
+        self._viz_thread.start()
+
+    def _stop_viz_worker(self) -> None:
+        self._viz_running = False
+        self._viz_event.set()
+        if self._viz_thread:
+            self._viz_thread.join(timeout=1.0)
+            self._viz_thread = None
+
+    def _viz_worker(self) -> None:
+        # Sleeps until the callback queues a block; _stop_viz_worker() wakes it
+        ring = self._viz_ring
+        while True:
+            self._viz_event.wait()
+            self._viz_event.clear()
+            if not self._viz_running:
+                return
+            block = ring.peek()
+            while block is not None:
+                try:
+                    self._update_visualization(block)
+                except Exception:
+                    self._logger.exception("Spectrum update failed")
+                ring.advance()
+                block = ring.peek()
+
+    def _update_visualization(self, samples: np.ndarray) -> None:
+        """Compute the level and spectrum bands of a block and publish them.
 
-        # Calculate overall RMS level
-        rms = np.sqrt(np.mean(audio ** 2))
-        level = min(1.0, rms * 80)
-        with _level_lock:
-            _current_level = level
-
-        # Compute FFT spectrum for visualization (32 bands)
-        # Focus on actual voice frequency range: 200-4000 Hz
-        # This is where speech formants and consonants live
-        fft = np.fft.rfft(audio)
-        magnitudes = np.abs(fft)
-
-        n_bins = len(magnitudes)
-        bands = []
-        # Voice-focused frequency range (200 Hz to 4000 Hz)
-        min_freq, max_freq = 200, 4000
-        num_bands = 32
-        for i in range(num_bands):
-            # Log-spaced frequency boundaries within voice range
-            f_low = min_freq * (max_freq / min_freq) ** (i / num_bands)
-            f_high = min_freq * (max_freq / min_freq) ** ((i + 1) / num_bands)
-            # Convert to FFT bin indices
-            bin_low = int(f_low * n_bins * 2 / self.config.sample_rate)
-            bin_high = int(f_high * n_bins * 2 / self.config.sample_rate)
-            bin_low = max(0, min(bin_low, n_bins - 1))
-            bin_high = max(bin_low + 1, min(bin_high, n_bins))
-            # Average magnitude in this band
-            band_mag = np.mean(magnitudes[bin_low:bin_high]) if bin_high > bin_low else 0
-            bands.append(band_mag)
+        Args:
+            samples: Flattened float32 block; overwritten by the FFT.
+        """
+        frames = samples.size // self.config.channels
+        if frames != self._fft_frames:
+            # Variable-size block (blocksize=0); recompute the FFT layout
+            self._configure_spectrum(frames)
 
-        # Normalize bands - pure FFT, no fake bass
-        max_mag = max(bands) if bands else 1.0
-        if max_mag > 0:
-            bands = [min(1.0, (b / max_mag) * level * 3.0) for b in bands]
+        # Calculate overall RMS level
+        level = min(1.0, _recorder_kernels.rms(samples) * _LEVEL_GAIN)
+
+        # Compute FFT spectrum for visualization (32 voice-range bands) of
+        # the windowed block, in place; float32 input gives a complex64
+        # spectrum (scipy.fft, numpy >= 2)
+        np.multiply(samples, self._window, out=samples)
+        spectrum = _rfft(samples, self._fft_len)
+
+        # Average magnitude in each band
+        band_mags = self._bands
+        if _recorder_kernels.NUMBA_AVAILABLE:
+            # Magnitudes and band sums in one pass, no intermediate arrays
+            _recorder_kernels.band_means(
+                spectrum, self._band_lo, self._band_hi, self._inv_band_widths, band_mags
+            )
         else:
-            bands = [0.0] * 32
-
-        with _spectrum_lock:
-            _spectrum_bands = bands
+            magnitudes = self._magnitudes
+            np.abs(spectrum, out=magnitudes[:-1])
+            band_sums = np.add.reduceat(magnitudes, self._band_index, out=self._band_sums)
+            np.multiply(band_sums[::2], self._inv_band_widths, out=band_mags)
 
-        # Store chunk based on recording state
-        chunk = indata.copy()
-        with self._lock:
-            if self._recording:
-                # Store chunks for transcription
-                self._recorded_chunks.append(chunk)
-            else:
-                # Not recording - fill pre-roll buffer (circular)
-                self._preroll_buffer.append(chunk)
+        # Normalize bands - pure FFT, no fake bass
+        max_mag = float(band_mags.max())
+        scale = level * _BAND_GAIN / max_mag if max_mag > 0 else 0.0
+        np.multiply(band_mags, scale, out=band_mags)
+        np.minimum(band_mags, 1.0, out=band_mags)
+
+        self._snapshot_seq += 1
+        self._snapshot[0] = level
+        self._snapshot[1:] = band_mags
+        self._snapshot_seq += 1
+
+    def _take_preroll(self, recorded: _RecordBuffer) -> None:
+        """Move the pre-roll buffer to the beginning of a recording."""
+        if len(self._preroll_buffer):
+            self._logger.debug("Including %d pre-roll frames", len(self._preroll_buffer))
+            self._preroll_buffer.drain_into(recorded)
+
+    def _read_preroll(self) -> np.ndarray:
+        """Copy the pre-roll while the callback may still be filling it.
+
+        Retries until no callback ran during the copy (seqlock-style).
+        """
+        while True:
+            seq = self._callback_seq
+            if not seq & 1:
+                samples = np.array(self._preroll_buffer.getvalue())
+                if self._callback_seq == seq:
+                    return samples
+            time.sleep(0)
+
+    def _read_snapshot(self) -> np.ndarray:
+        """Return a consistent copy of the level/spectrum snapshot."""
+        while True:
+            seq = self._snapshot_seq
+            if not seq & 1:
+                values = self._snapshot.copy()
+                if self._snapshot_seq == seq:
+                    return values
+            time.sleep(0)
+
+    def _wait_for_callback(self) -> None:
+        """Wait until an audio callback that is in progress has returned."""
+        seq = self._callback_seq
+        while seq & 1 and self._callback_seq == seq:
+            time.sleep(0)
 
     def prime(self) -> bool:
         """Start the audio stream for pre-roll buffering.
@@ -184,7 +537,10 @@ class AudioRecorder:
             return True
 
         try:
-            self._stream = sd.InputStream(
+            # JIT-compile the spectrum kernels before the first block arrives
+            _recorder_kernels.warmup()
+            self._ensure_viz_worker()
+            self._stream = sd.RawInputStream(
                 samplerate=self.config.sample_rate,
                 channels=self.config.channels,
                 dtype=self.config.dtype,
@@ -216,25 +572,16 @@ class AudioRecorder:
             return True
 
         try:
-            # Initialize recording buffer
-            if self._max_chunks:
-                self._recorded_chunks = deque(maxlen=self._max_chunks)
-            else:
-                self._recorded_chunks = deque()
-
-            with self._lock:
-                # Copy pre-roll buffer to beginning of recording
-                if self._preroll_buffer:
-                    self._logger.debug("Including %d pre-roll chunks", len(self._preroll_buffer))
-                    for chunk in self._preroll_buffer:
-                        self._recorded_chunks.append(chunk)
-                    self._preroll_buffer.clear()
-
-                self._recording = True
+            # Publish a new recording buffer (the previous one was handed out
+            # by stop()); the next audio block prepends the pre-roll to it
+            self._recorded = self._new_record_buffer()
+            self._recording = True
 
             # If not primed, start stream now (fallback for direct start())
             if not self._primed:
-                self._stream = sd.InputStream(
+                _recorder_kernels.warmup()
+                self._ensure_viz_worker()
+                self._stream = sd.RawInputStream(
                     samplerate=self.config.sample_rate,
                     channels=self.config.channels,
                     dtype=self.config.dtype,
@@ -256,20 +603,33 @@ class AudioRecorder:
         the pre-roll buffer. Call shutdown() to fully stop the stream.
 
         Returns:
-            Numpy array of all recorded audio, or None if no audio.
+            Numpy array of all recorded audio (1-D for mono, otherwise
+            (frames, channels)), or None if no audio.
         """
         if not self._recording:
             return None
 
-        with self._lock:
-            self._recording = False
-
-            if not self._recorded_chunks:
-                return None
+        recorded = self._recorded
+        self._recorded = None
+        self._recording = False
+        self._wait_for_callback()
+        # From here on the callback no longer touches this buffer
+        if recorded is not None and recorded is not self._writing:
+            # Stopped before any block arrived; the pre-roll is all there is.
+            # The callback may be refilling it, so it is copied here and
+            # cleared by the callback, or the next recording would repeat it
+            recorded.append(self._read_preroll())
+            self._preroll_consumed = True
+        # Callbacks only compare against _writing while a buffer is published,
+        # so it can be dropped here to release the finished recording
+        self._writing = None
+
+        if recorded is None or not len(recorded):
+            return None
 
-            # Concatenate all chunks
-            audio = np.concatenate(list(self._recorded_chunks))
-            self._recorded_chunks = deque()
+        # The buffer is not written again (start() makes a new one), so
+        # its contents are returned without copying
+        audio = recorded.getvalue()
 
         # If primed, keep stream running for pre-roll
         # If not primed, stop the stream
@@ -280,8 +640,9 @@ class AudioRecorder:
             except Exception:
                 self._logger.debug("Failed to stop audio stream cleanly", exc_info=True)
             self._stream = None
+            self._stop_viz_worker()
 
-        return np.squeeze(audio)
+        return audio
 
     def shutdown(self) -> None:
         """Fully stop the audio stream.
@@ -298,6 +659,7 @@ class AudioRecorder:
             except Exception:
                 self._logger.debug("Failed to shutdown audio stream cleanly", exc_info=True)
             self._stream = None
+        self._stop_viz_worker()
 
     @property
     def is_recording(self) -> bool:
@@ -310,8 +672,7 @@ class AudioRecorder:
         Thread-safe method to get the most recent audio level
         calculated from microphone input during recording.
         """
-        with _level_lock:
-            return _current_level
+        return float(self._read_snapshot()[0])
 
     def get_spectrum_bands(self) -> list[float]:
         """Get current spectrum bands (16 floats, 0.0-1.0) for visualization.
@@ -319,8 +680,7 @@ class AudioRecorder:
         Thread-safe method to get FFT spectrum divided into 16 logarithmic
         frequency bands covering voice range (~85Hz to ~8kHz).
         """
-        with _spectrum_lock:
-            return _spectrum_bands.copy()
+        return self._read_snapshot()[1:].tolist()
 
     def get_volume_level(self, chunk: np.ndarray) -> float:
         """Calculate volume level (0-1) for a chunk.
@@ -334,14 +694,15 @@ class AudioRecorder:
         if chunk.size == 0:
             return 0.0
 
-        # RMS volume
-        rms = np.sqrt(np.mean(chunk**2))
+        # Mean square power; 10*log10 of it is the RMS level in dB
+        # (20*log10(sqrt(x))), so no square root is needed
+        power = _recorder_kernels.mean_square(chunk)
 
         # Normalize to 0-1 range (assuming typical voice levels)
         # Adjust these thresholds based on testing
         min_db = -60
         max_db = -10
-        db = 20 * np.log10(max(rms, 1e-10))
+        db = 10.0 * math.log10(max(power, 1e-20))
         normalized = (db - min_db) / (max_db - min_db)
         return max(0.0, min(1.0, normalized))
 
@@ -1,15 +1,32 @@
 """Audio feedback for CLD (Windows only)."""
 
+import functools
 import logging
 import sys
 import winsound
 from pathlib import Path
-from typing import Literal
+from typing import Literal, Optional
 
 SoundEvent = Literal["start", "stop", "complete", "error", "warning"]
 _logger = logging.getLogger(__name__)
 
+# Fallback Windows system sounds when no .wav file is bundled
+_SYSTEM_SOUNDS = {
+    "start": winsound.MB_OK,
+    "stop": winsound.MB_OK,
+    "complete": winsound.MB_OK,
+    "error": winsound.MB_ICONHAND,
+    "warning": winsound.MB_ICONEXCLAMATION,
+}
 
+# Resolved .wav path per event (None: use the system sound), filled on first
+# play so later plays skip the filesystem lookups. winsound cannot play a
+# memory image asynchronously (SND_MEMORY | SND_ASYNC raises), so playback
+# still goes through SND_FILENAME.
+_sound_cache: dict[str, Optional[str]] = {}
+
+
+@functools.lru_cache(maxsize=1)
 def _is_frozen() -> bool:
     """Check if running as frozen exe (PyInstaller or Nuitka)."""
     # PyInstaller sets sys.frozen
@@ -20,11 +37,13 @@ def _is_frozen() -> bool:
     return '__compiled__' in dir(main_mod)
 
 
+@functools.lru_cache(maxsize=1)
 def _get_exe_dir() -> Path:
     """Get directory containing the executable."""
     return Path(sys.executable).parent
 
 
+@functools.lru_cache(maxsize=1)
 def _get_sounds_dir() -> Path:
     """Get the sounds directory."""
     if _is_frozen():
@@ -54,21 +73,17 @@ def play_sound(event: SoundEvent) -> None:
     """
     try:
         # Check for custom sound files first
-        sounds_dir = _get_sounds_dir()
-        sound_file = sounds_dir / f"{event}.wav"
-        if sound_file.exists():
-            winsound.PlaySound(str(sound_file), winsound.SND_FILENAME | winsound.SND_ASYNC)
+        if event in _sound_cache:
+            sound_path = _sound_cache[event]
+        else:
+            sound_file = _get_sounds_dir() / f"{event}.wav"
+            sound_path = str(sound_file) if sound_file.exists() else None
+            _sound_cache[event] = sound_path
+        if sound_path is not None:
+            winsound.PlaySound(sound_path, winsound.SND_FILENAME | winsound.SND_ASYNC)
             return
 
         # Fallback to Windows system sounds
-        sound_map = {
-            "start": winsound.MB_OK,
-            "stop": winsound.MB_OK,
-            "complete": winsound.MB_OK,
-            "error": winsound.MB_ICONHAND,
-            "warning": winsound.MB_ICONEXCLAMATION,
-        }
-        sound_type = sound_map.get(event, winsound.MB_OK)
-        winsound.MessageBeep(sound_type)
+        winsound.MessageBeep(_SYSTEM_SOUNDS.get(event, winsound.MB_OK))
     except Exception:
         pass  # Silently fail
@@ -1,16 +1,54 @@
 """CLD UI components."""
 
+from __future__ import annotations
+
+import functools
+import importlib
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from cld.ui.overlay import STTOverlay
+    from cld.ui.hardware import HardwareInfo, detect_hardware, get_available_models
+    from cld.ui.key_scanner import KeyScanner, KeyCapture, scan_key
+    from cld.ui.settings_popup import SettingsPopup
+    from cld.ui.settings_dialog import SettingsDialog, show_settings
+    from cld.ui.tray import TrayIcon, is_tray_available
+
+# Re-exported names and their submodules, imported on first access (PEP 562)
+# so importing one submodule (e.g. cld.ui.hardware) does not pull in Tk,
+# PIL and pystray through this package
+_LAZY_EXPORTS = {
+    "STTOverlay": "cld.ui.overlay",
+    "HardwareInfo": "cld.ui.hardware",
+    "detect_hardware": "cld.ui.hardware",
+    "get_available_models": "cld.ui.hardware",
+    "KeyScanner": "cld.ui.key_scanner",
+    "KeyCapture": "cld.ui.key_scanner",
+    "scan_key": "cld.ui.key_scanner",
+    "SettingsPopup": "cld.ui.settings_popup",
+    "SettingsDialog": "cld.ui.settings_dialog",
+    "show_settings": "cld.ui.settings_dialog",
+    "TrayIcon": "cld.ui.tray",
+    "is_tray_available": "cld.ui.tray",
+}
+
 
-from cld.ui.overlay import STTOverlay
-from cld.ui.hardware import HardwareInfo, detect_hardware, get_available_models
-from cld.ui.key_scanner import KeyScanner, KeyCapture, scan_key
-from cld.ui.settings_popup import SettingsPopup
-from cld.ui.settings_dialog import SettingsDialog, show_settings
-from cld.ui.tray import TrayIcon, is_tray_available
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
 
 
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
+
+@functools.lru_cache(maxsize=1)
 def _is_frozen() -> bool:
     """Check if running as frozen exe (PyInstaller or Nuitka)."""
     # PyInstaller sets sys.frozen
@@ -21,9 +59,12 @@ def _is_frozen() -> bool:
     return "__compiled__" in dir(main_mod)
 
 
+@functools.lru_cache(maxsize=1)
 def get_app_icon_path() -> Path:
     """Get path to cld_icon.png for all UI components.
 
+    Resolved once; the tray, overlay and dialogs all share the result.
+
     Returns:
         Path to cld_icon.png in project root (source) or _internal (frozen exe).
     """
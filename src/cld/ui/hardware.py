@@ -1,14 +1,90 @@
 """Hardware detection for STT model recommendations."""
 
+from __future__ import annotations
+
+import functools
+import json
 import logging
-import subprocess
-from dataclasses import dataclass
-from typing import List, Optional
+import os
+import sys
+import threading
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional
 
-logger = logging.getLogger(__name__)
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+# ctypes, subprocess, shutil, tempfile, importlib.util, concurrent.futures and
+# pywin32 are imported inside the functions that use them, so importing this
+# module for HardwareInfo stays cheap (os and sys are already loaded by logging)
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# Display adapter queries and the ggml-vulkan.dll lookup are Windows-only
+_IS_WINDOWS = sys.platform == "win32"
+
+# Prefix of the device lines whisper.cpp's Vulkan backend prints to stderr,
+# e.g. "ggml_vulkan: 0 = NVIDIA GeForce RTX 4090 (NVIDIA) | uma: 0 | ..."
+_VK_DEVICE_PREFIX = "ggml_vulkan:"
+
+# Display adapter name keywords (lowercase) for the non-Vulkan GPU fallback
+_VIRTUAL_GPU_KEYWORDS = ("parsec", "virtual", "microsoft")
+_INTEGRATED_GPU_KEYWORDS = ("radeon graphics", "uhd graphics", "iris")
+_NVIDIA_GPU_KEYWORDS = ("nvidia", "geforce", "rtx", "gtx")
+_AMD_GPU_KEYWORDS = ("radeon", "amd")
+
+# (engine, model) recommendations: any GPU backend, or CPU-only indexed by
+# core count (the last entry covers 8 cores and up)
+_GPU_RECOMMENDATION = ("whisper", "medium-q5_0")
+_CPU_RECOMMENDATIONS = (
+    ("whisper", "small"),  # 0-1 cores
+    ("whisper", "small"),
+    ("whisper", "small"),  # 2-3 cores
+    ("whisper", "small"),
+    ("whisper", "medium-q5_0"),  # 4-7 cores: quantized
+    ("whisper", "medium-q5_0"),
+    ("whisper", "medium-q5_0"),
+    ("whisper", "medium-q5_0"),
+    ("whisper", "medium"),  # 8+ cores: full precision
+)
+
+# detect_hardware() result persisted in the config dir and reused by later
+# launches while the fingerprint matches; CLD_REFRESH_HW=1 forces a new probe
+_HARDWARE_CACHE_FILE = "hardware_cache.json"
+_HARDWARE_CACHE_VERSION = 1
+
+# PowerShell itself takes ~0.3-1 s to start, so this only cuts off a hung
+# WMI query (the old wmic call waited 5 s)
+_CIM_QUERY_TIMEOUT = 3.0
+
+# Detection started at app startup by start_background_detect()
+_detect_future: Optional[Future[HardwareInfo]] = None
+_detect_lock = threading.Lock()
+
+# DISPLAY_DEVICEW.StateFlags bit for pseudo-devices that mirror another display
+_DISPLAY_DEVICE_MIRRORING_DRIVER = 0x00000008
+
+# DXGI: IID_IDXGIFactory1, vtable slots of IDXGIFactory1::EnumAdapters1,
+# IDXGIAdapter1::GetDesc1 and IUnknown::Release, the end-of-list HRESULT and
+# the DXGI_ADAPTER_DESC1.Flags bit of the software (WARP) rasterizer
+_IID_IDXGI_FACTORY1 = "{770aae78-f26f-4dba-a829-253c83d1b387}"
+_DXGI_ENUM_ADAPTERS1 = 12
+_DXGI_GET_DESC1 = 10
+_COM_RELEASE = 2
+_DXGI_ERROR_NOT_FOUND = 0x887A0002
+_DXGI_ADAPTER_FLAG_SOFTWARE = 0x2
+
+# Adapters with more dedicated video memory than this are taken as discrete
+# GPUs when picking the primary one (integrated GPUs reserve ~128 MB or less)
+_DISCRETE_GPU_MIN_MEMORY = 512 * 1024 * 1024
+
+# WBEM_FLAG_RETURN_IMMEDIATELY | WBEM_FLAG_FORWARD_ONLY: semisynchronous,
+# non-rewindable enumeration (WMI frees each object once it is read)
+_WBEM_QUERY_FLAGS = 0x10 | 0x20
+
+
+@dataclass(frozen=True, slots=True)
 class GPUDeviceInfo:
     """Information about a single GPU device."""
 
@@ -21,9 +97,13 @@ class GPUDeviceInfo:
         return self.name
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class HardwareInfo:
-    """Hardware capability information."""
+    """Hardware capability information.
+
+    Frozen because detect_hardware() hands the same cached instance to
+    every caller.
+    """
 
     has_cuda: bool = False
     has_vulkan: bool = False
@@ -56,156 +136,546 @@ class HardwareInfo:
         return f"CPU ({self.cpu_cores} cores)"
 
 
-def _detect_gpu_wmi() -> tuple[bool, Optional[str]]:
-    """Detect GPU via Windows WMI.
+@dataclass(frozen=True, slots=True)
+class _GPUAdapter:
+    """A display adapter reported by Windows."""
+
+    name: str
+    # Dedicated video memory in bytes, if the query reports it
+    dedicated_memory: Optional[int] = None
+
+
+def _enum_dxgi_adapters() -> List[_GPUAdapter]:
+    """List GPU names in-process via DXGI (IDXGIFactory1::EnumAdapters1).
+
+    Unlike EnumDisplayDevicesW this includes adapters without a display
+    output, such as the discrete GPU of an Optimus laptop or a headless
+    compute card.
 
     Returns:
-        Tuple of (has_gpu, gpu_name).
+        Adapters in DXGI order with their dedicated video memory, without
+        software adapters.
+
+    Raises:
+        OSError: If DXGI is unavailable or a call fails.
     """
+    import ctypes
+    from ctypes import wintypes
+
+    class DXGI_ADAPTER_DESC1(ctypes.Structure):
+        _fields_ = [
+            ("Description", wintypes.WCHAR * 128),
+            ("VendorId", wintypes.UINT),
+            ("DeviceId", wintypes.UINT),
+            ("SubSysId", wintypes.UINT),
+            ("Revision", wintypes.UINT),
+            ("DedicatedVideoMemory", ctypes.c_size_t),
+            ("DedicatedSystemMemory", ctypes.c_size_t),
+            ("SharedSystemMemory", ctypes.c_size_t),
+            ("AdapterLuid", wintypes.DWORD * 2),  # LUID {LowPart, HighPart}
+            ("Flags", wintypes.UINT),
+        ]
+
+    def com_method(obj, slot, *argtypes, restype=ctypes.HRESULT):
+        # HRESULT results raise OSError on failure
+        vtable = ctypes.cast(obj, ctypes.POINTER(ctypes.POINTER(ctypes.c_void_p)))[0]
+        return ctypes.WINFUNCTYPE(restype, ctypes.c_void_p, *argtypes)(vtable[slot])
+
+    def release(obj):
+        com_method(obj, _COM_RELEASE, restype=wintypes.ULONG)(obj)
+
+    iid = (ctypes.c_byte * 16)()
+    ctypes.oledll.ole32.IIDFromString(_IID_IDXGI_FACTORY1, iid)
+    factory = ctypes.c_void_p()
+    # oledll raises OSError for failing HRESULTs
+    ctypes.oledll.dxgi.CreateDXGIFactory1(iid, ctypes.byref(factory))
+
+    adapters: List[_GPUAdapter] = []
     try:
-        creationflags = 0
-        if hasattr(subprocess, "CREATE_NO_WINDOW"):
-            creationflags = subprocess.CREATE_NO_WINDOW
-
-        result = subprocess.run(
-            ["wmic", "path", "win32_VideoController", "get", "Name"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-            creationflags=creationflags,
+        enum_adapters = com_method(
+            factory, _DXGI_ENUM_ADAPTERS1, wintypes.UINT, ctypes.POINTER(ctypes.c_void_p)
         )
-        if result.returncode == 0 and result.stdout.strip():
-            lines = [line.strip() for line in result.stdout.strip().split("\n") if line.strip()]
-            # Skip header "Name", return first real GPU
-            for line in lines[1:]:
-                if line and line != "Name":
-                    return True, line
+        index = 0
+        while True:
+            adapter = ctypes.c_void_p()
+            try:
+                enum_adapters(factory, index, ctypes.byref(adapter))
+            except OSError as e:
+                if (e.winerror or 0) & 0xFFFFFFFF == _DXGI_ERROR_NOT_FOUND:
+                    break
+                raise
+            try:
+                desc = DXGI_ADAPTER_DESC1()
+                get_desc = com_method(adapter, _DXGI_GET_DESC1, ctypes.POINTER(DXGI_ADAPTER_DESC1))
+                get_desc(adapter, ctypes.byref(desc))
+            finally:
+                release(adapter)
+            name = desc.Description.strip()
+            if name and not desc.Flags & _DXGI_ADAPTER_FLAG_SOFTWARE:
+                adapters.append(_GPUAdapter(name, desc.DedicatedVideoMemory))
+            index += 1
+    finally:
+        release(factory)
+    return adapters
+
+
+def _enum_display_adapters() -> List[str]:
+    """List display adapter names in-process via user32.EnumDisplayDevicesW.
+
+    Returns:
+        Adapter names in enumeration order, without duplicates (one entry is
+        reported per adapter output) or mirroring drivers.
+    """
+    import ctypes
+    from ctypes import wintypes
+
+    class DISPLAY_DEVICEW(ctypes.Structure):
+        _fields_ = [
+            ("cb", wintypes.DWORD),
+            ("DeviceName", wintypes.WCHAR * 32),
+            ("DeviceString", wintypes.WCHAR * 128),
+            ("StateFlags", wintypes.DWORD),
+            ("DeviceID", wintypes.WCHAR * 128),
+            ("DeviceKey", wintypes.WCHAR * 128),
+        ]
+
+    user32 = ctypes.windll.user32
+    device = DISPLAY_DEVICEW()
+    device.cb = ctypes.sizeof(device)
+    names: List[str] = []
+    index = 0
+    while user32.EnumDisplayDevicesW(None, index, ctypes.byref(device), 0):
+        name = device.DeviceString.strip()
+        if name and not device.StateFlags & _DISPLAY_DEVICE_MIRRORING_DRIVER and name not in names:
+            names.append(name)
+        index += 1
+    return names
+
+
+def _query_wmi_video_controllers() -> List[_GPUAdapter]:
+    """List video controllers through WMI in-process (pywin32).
+
+    AdapterRAM is an unsigned 32-bit field that WMI scripting hands back as
+    a signed VT_I4, so values of 2 GB and up arrive negative; it is masked
+    back to unsigned. Cards with 4 GB or more still report about 4 GB
+    (0xFFF00000), which is enough to tell discrete from integrated GPUs.
+
+    Raises:
+        ImportError: If pywin32 is not installed.
+    """
+    import pythoncom
+    import win32com.client
+
+    # Detection may run on a worker thread, which needs its own COM apartment
+    pythoncom.CoInitialize()
+    try:
+        locator = win32com.client.Dispatch("WbemScripting.SWbemLocator")
+        service = locator.ConnectServer(".", "root\\cimv2")
+        controllers = service.ExecQuery(
+            "SELECT Name, AdapterRAM FROM Win32_VideoController", "WQL", _WBEM_QUERY_FLAGS
+        )
+        return [
+            _GPUAdapter(
+                c.Name.strip(),
+                c.AdapterRAM & 0xFFFFFFFF if c.AdapterRAM is not None else None,
+            )
+            for c in controllers
+            if c.Name and c.Name.strip()
+        ]
+    finally:
+        pythoncom.CoUninitialize()
+
+
+@functools.lru_cache(maxsize=1)
+def _powershell_exe() -> Optional[str]:
+    """Resolve powershell.exe on PATH once (None if it is not installed)."""
+    import shutil
+
+    return shutil.which("powershell")
+
+
+def _query_video_controllers() -> List[str]:
+    """List video controller names via PowerShell CIM (Win32_VideoController)."""
+    import subprocess
+
+    powershell = _powershell_exe()
+    if powershell is None:
+        return []
+
+    creationflags = 0
+    if hasattr(subprocess, "CREATE_NO_WINDOW"):
+        creationflags = subprocess.CREATE_NO_WINDOW
+
+    # -NoProfile skips loading user profile scripts; names are printed one
+    # per line with no header, as UTF-8 so the console code page cannot
+    # garble (or fail to decode) non-ASCII adapter names
+    result = subprocess.run(
+        [
+            powershell,
+            "-NoLogo",
+            "-NoProfile",
+            "-NonInteractive",
+            "-Command",
+            "[Console]::OutputEncoding = [Text.Encoding]::UTF8; "
+            "Get-CimInstance Win32_VideoController | Select-Object -ExpandProperty Name",
+        ],
+        capture_output=True,
+        encoding="utf-8",
+        errors="replace",
+        timeout=_CIM_QUERY_TIMEOUT,
+        creationflags=creationflags,
+    )
+    if result.returncode != 0:
+        return []
+    return [line.strip() for line in result.stdout.splitlines() if line.strip()]
+
+
+@functools.lru_cache(maxsize=1)
+def _list_gpu_adapters() -> tuple[_GPUAdapter, ...]:
+    """Return the system's display adapters.
+
+    Uses DXGI, which needs no subprocess and lists every adapter; if that
+    fails, Win32_VideoController is queried through WMI in-process when
+    pywin32 is installed, then through PowerShell CIM (wmic is deprecated
+    and absent on newer Windows builds). EnumDisplayDevicesW is the last
+    resort, as it misses GPUs that drive no display. Only DXGI and WMI
+    report dedicated memory. Empty on other platforms.
+    """
+    if not _IS_WINDOWS:
+        return ()
+
+    import subprocess
+
+    try:
+        adapters = _enum_dxgi_adapters()
+        if adapters:
+            return tuple(adapters)
+    except Exception as e:
+        logger.debug("DXGI adapter enumeration failed: %s", e)
+
+    try:
+        adapters = _query_wmi_video_controllers()
+        if adapters:
+            return tuple(adapters)
+    except ImportError:
+        pass
+    except Exception as e:
+        logger.debug("WMI video controller query failed: %s", e)
+
+    try:
+        names = _query_video_controllers()
+        if names:
+            return tuple(_GPUAdapter(name) for name in names)
     except FileNotFoundError:
         pass
     except subprocess.TimeoutExpired:
-        logger.debug("wmic timed out")
+        logger.debug("Get-CimInstance timed out")
+    except Exception as e:
+        logger.debug("Get-CimInstance failed: %s", e)
+
+    try:
+        return tuple(_GPUAdapter(name) for name in _enum_display_adapters())
     except Exception as e:
-        logger.debug("wmic failed: %s", e)
-    return False, None
+        logger.debug("EnumDisplayDevices failed: %s", e)
+    return ()
+
+
+@functools.lru_cache(maxsize=1)
+def _physical_gpu_adapters() -> tuple[_GPUAdapter, ...]:
+    """Return the display adapters that are real GPUs, in Vulkan order.
+
+    Virtual adapters are dropped. Vulkan typically enumerates discrete
+    NVIDIA, then discrete AMD, then integrated GPUs, so the names are
+    ordered the same way.
+    """
+    nvidia_discrete = []
+    amd_discrete = []
+    integrated = []
+    for adapter in _list_gpu_adapters():
+        lower = adapter.name.lower()
+        # Skip known virtual display adapters
+        if any(keyword in lower for keyword in _VIRTUAL_GPU_KEYWORDS):
+            continue
+        # Categorize to match Vulkan enumeration order
+        if any(keyword in lower for keyword in _INTEGRATED_GPU_KEYWORDS):
+            integrated.append(adapter)
+        elif any(keyword in lower for keyword in _NVIDIA_GPU_KEYWORDS):
+            nvidia_discrete.append(adapter)
+        elif any(keyword in lower for keyword in _AMD_GPU_KEYWORDS):
+            amd_discrete.append(adapter)
+        else:
+            # Unknown - treat as discrete
+            nvidia_discrete.append(adapter)
+    return tuple(nvidia_discrete + amd_discrete + integrated)
+
+
+def _detect_gpu() -> tuple[bool, Optional[str]]:
+    """Detect the primary GPU from the display adapter list.
+
+    The first adapter with more than 512 MB of dedicated memory wins; if
+    none reports that much (or memory is unknown), the first in Vulkan
+    order.
+
+    Returns:
+        Tuple of (has_gpu, gpu_name).
+    """
+    adapters = _physical_gpu_adapters()
+    if not adapters:
+        return False, None
+    for adapter in adapters:
+        if (adapter.dedicated_memory or 0) > _DISCRETE_GPU_MIN_MEMORY:
+            return True, adapter.name
+    return True, adapters[0].name
 
 
 def enumerate_gpus() -> List[GPUDeviceInfo]:
     """Enumerate GPUs as seen by whisper.cpp's Vulkan backend.
 
-    IMPORTANT: Uses Vulkan enumeration, not Windows WMI, because whisper.cpp
-    uses Vulkan device indices. WMI may include virtual GPUs (like Parsec)
-    that Vulkan doesn't see, causing index mismatches.
+    IMPORTANT: Uses Vulkan enumeration, not the Windows display adapter list,
+    because whisper.cpp uses Vulkan device indices. The adapter list may
+    include virtual GPUs (like Parsec) that Vulkan doesn't see, causing
+    index mismatches.
+
+    The probe runs once per process; later calls return a copy of the
+    cached list.
 
     Returns:
         List of GPUDeviceInfo matching whisper.cpp's Vulkan device order.
     """
-    devices = []
+    return list(_enumerate_gpus())
+
+
+@functools.lru_cache(maxsize=1)
+def _pywhispercpp_origin() -> Optional[Path]:
+    """Return the _pywhispercpp extension file, if it can be found.
+
+    find_spec() walks sys.path on every call, and the location cannot
+    change while the process runs.
+    """
+    import importlib.util
 
-    # Try to get Vulkan device list from pywhispercpp by capturing C-level output
     try:
-        import _pywhispercpp as pw
-        import os
-        import sys
-        import tempfile
-        import re
+        spec = importlib.util.find_spec("_pywhispercpp")
+    except Exception:
+        return None
+    if spec and spec.origin:
+        return Path(spec.origin)
+    return None
 
-        # Capture C-level stderr by redirecting file descriptor
-        # This is necessary because whisper.cpp prints directly to stderr
-        old_stderr_fd = os.dup(2)
-        with tempfile.NamedTemporaryFile(mode='w+', delete=False, suffix='.txt') as tmp:
-            tmp_path = tmp.name
 
-        # Redirect stderr to temp file
-        with open(tmp_path, 'w') as tmp_file:
-            os.dup2(tmp_file.fileno(), 2)
+@functools.lru_cache(maxsize=1)
+def _vulkan_dll_path() -> Optional[Path]:
+    """Return ggml-vulkan.dll shipped next to _pywhispercpp, if present.
+
+    Cached: a DLL installed while CLD is running is not picked up.
+    """
+    if not _IS_WINDOWS:
+        return None
+
+    origin = _pywhispercpp_origin()
+    if origin is None:
+        return None
+    vulkan_dll = origin.parent / "ggml-vulkan.dll"
+    if vulkan_dll.exists():
+        return vulkan_dll
+    # delvewheel-repaired wheels add a hash suffix (ggml-vulkan-<hash>.dll)
+    return next(origin.parent.glob("ggml-vulkan*.dll"), None)
 
-            # Trigger device enumeration by getting system info
-            _ = pw.whisper_print_system_info()
 
-            # Flush stderr
-            sys.stderr.flush() if sys.stderr else None
+def _short_gpu_name(name_full: str) -> str:
+    """Shorten a Vulkan device name for display.
 
-        # Restore stderr
-        os.dup2(old_stderr_fd, 2)
-        os.close(old_stderr_fd)
+    "NVIDIA GeForce RTX 4090 (NVIDIA)" -> "RTX 4090"
+    """
+    # Drop the parenthetical vendor info, then common prefixes
+    name = name_full.split("(")[0].strip()
+    return name.replace("NVIDIA GeForce ", "").replace("AMD ", "")
 
-        # Read captured output
-        with open(tmp_path, 'r') as f:
-            output = f.read()
 
-        # Clean up temp file
+def _vulkan_devices_from_dll() -> List[GPUDeviceInfo]:
+    """Query whisper.cpp's Vulkan devices through ggml-vulkan's exported API.
+
+    Raises:
+        AttributeError: If the DLL does not export the device functions.
+    """
+    import ctypes
+
+    dll_path = _vulkan_dll_path()
+    if dll_path is None:
+        return []
+    # Already loaded by _pywhispercpp, so this returns the same module
+    lib = ctypes.CDLL(str(dll_path))
+    get_count = lib.ggml_backend_vk_get_device_count
+    get_count.argtypes = []
+    get_count.restype = ctypes.c_int
+    get_description = lib.ggml_backend_vk_get_device_description
+    get_description.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_size_t]
+    get_description.restype = None
+
+    description = ctypes.create_string_buffer(256)
+    devices = []
+    for index in range(get_count()):
+        get_description(index, description, len(description))
+        name = description.value.decode("utf-8", errors="replace")
+        devices.append(GPUDeviceInfo(index=index, name=_short_gpu_name(name)))
+    return devices
+
+
+@functools.lru_cache(maxsize=1)
+def _system_info_capture() -> tuple[str, str]:
+    """Call whisper_print_system_info() once per process.
+
+    The backends print their device lists (e.g. ggml_vulkan's) straight to
+    the C-level stderr while initializing, which only happens on the first
+    call, so fd 2 is pointed at an anonymous temporary file meanwhile. If
+    that is not possible (e.g. no fd 2 in a windowed build), the call is
+    made without capturing and the output is empty.
+
+    Returns:
+        Tuple of (system info string, captured stderr output).
+
+    Raises:
+        ImportError: If pywhispercpp is not installed.
+    """
+    import tempfile
+
+    import _pywhispercpp as pw
+
+    capture = None
+    saved_fd = None
+    try:
+        capture = tempfile.TemporaryFile()
+        if sys.stderr:
+            sys.stderr.flush()
+        saved_fd = os.dup(2)
+        os.dup2(capture.fileno(), 2)
+    except OSError as e:
+        if saved_fd is not None:
+            os.close(saved_fd)
+        if capture is not None:
+            capture.close()
+        logger.debug("Cannot capture whisper.cpp backend output: %s", e)
+        return pw.whisper_print_system_info(), ""
+
+    with capture:
         try:
-            os.unlink(tmp_path)
-        except Exception:
-            pass
+            info = pw.whisper_print_system_info()
+        finally:
+            os.dup2(saved_fd, 2)
+            os.close(saved_fd)
+        capture.seek(0)
+        output = capture.read().decode("utf-8", errors="replace")
+    if output:
+        logger.debug("whisper.cpp backend output:\n%s", output.rstrip())
+    return info, output
+
+
+def _system_info() -> str:
+    """Return the (cached) whisper_print_system_info() string."""
+    return _system_info_capture()[0]
+
+
+def _vulkan_devices_from_system_info() -> List[GPUDeviceInfo]:
+    """Parse the Vulkan device list whisper.cpp printed while loading."""
+    output = _system_info_capture()[1]
+    devices = []
+    for line in output.splitlines():
+        if not line.startswith(_VK_DEVICE_PREFIX):
+            continue
+        # "<index> = <name> (<vendor>) | uma: ..."; other ggml_vulkan lines
+        # (e.g. "Found 2 Vulkan devices:") have no "<index> =" part
+        index, sep, rest = line[len(_VK_DEVICE_PREFIX):].partition("=")
+        index = index.strip()
+        if not sep or not index.isdigit():
+            continue
+        name_full = rest.split("|", 1)[0].strip()
+        devices.append(GPUDeviceInfo(index=int(index), name=_short_gpu_name(name_full)))
+    return devices
+
+
+def _vulkan_devices() -> List[GPUDeviceInfo]:
+    """Enumerate whisper.cpp's Vulkan devices, preferring the direct API."""
+    try:
+        devices = _vulkan_devices_from_dll()
+        if devices:
+            return devices
+    except Exception as e:
+        logger.debug("ggml-vulkan device query failed: %s", e)
+    return _vulkan_devices_from_system_info()
 
-        # Parse "ggml_vulkan: X = GPU_NAME (vendor)" lines
-        pattern = r'ggml_vulkan:\s*(\d+)\s*=\s*([^|]+)'
-        for match in re.finditer(pattern, output):
-            index = int(match.group(1))
-            # Extract just the GPU name (before the parenthetical vendor info)
-            name_full = match.group(2).strip()
-            # Clean up: "NVIDIA GeForce RTX 4090 (NVIDIA)" -> "RTX 4090"
-            name = name_full.split('(')[0].strip()
-            # Simplify common prefixes
-            name = name.replace("NVIDIA GeForce ", "").replace("AMD ", "")
-            devices.append(GPUDeviceInfo(index=index, name=name))
 
+@functools.lru_cache(maxsize=1)
+def _enumerate_gpus() -> tuple[GPUDeviceInfo, ...]:
+    try:
+        devices = _vulkan_devices()
         if devices:
             logger.debug("Enumerated %d Vulkan GPUs: %s", len(devices),
                         [(d.index, d.name) for d in devices])
-            return devices
-
+            return tuple(devices)
     except Exception as e:
         logger.debug("Vulkan GPU enumeration failed: %s", e)
 
-    # Fallback to WMI if Vulkan enumeration fails, filtering virtual adapters
-    logger.debug("Falling back to WMI GPU enumeration")
+    # Fallback to the display adapter list if Vulkan enumeration fails,
+    # filtering virtual adapters
+    logger.debug("Falling back to display adapter GPU enumeration")
+    return tuple(
+        GPUDeviceInfo(index=index, name=adapter.name)
+        for index, adapter in enumerate(_physical_gpu_adapters())
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class _BackendProbe:
+    """GPU backends compiled into pywhispercpp, probed once per process."""
+
+    has_cuda: bool
+    has_vulkan: bool
+    system_info: str
+    vulkan_dll: bool
+    # Upper-cased section and feature names from system_info
+    tokens: frozenset[str] = frozenset()
+
+
+def _system_info_tokens(info: str) -> frozenset[str]:
+    """Split "WHISPER : COREML = 0 | CUDA : ARCHS = 890 | ..." into names."""
+    for separator in "|:=":
+        info = info.replace(separator, " ")
+    # Drop the flag values ("= 0", "= 890"), keeping only names
+    return frozenset(token.upper() for token in info.split() if not token.isdigit())
+
+
+@functools.lru_cache(maxsize=1)
+def _backend_probe() -> _BackendProbe:
+    """Inspect whisper_print_system_info() and ggml-vulkan.dll once.
+
+    The CUDA and Vulkan checks and get_gpu_backend_info() all read this
+    result instead of querying the extension separately.
+    """
     try:
-        creationflags = 0
-        if hasattr(subprocess, "CREATE_NO_WINDOW"):
-            creationflags = subprocess.CREATE_NO_WINDOW
-
-        result = subprocess.run(
-            ["wmic", "path", "win32_VideoController", "get", "Name"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-            creationflags=creationflags,
-        )
-        if result.returncode == 0 and result.stdout.strip():
-            lines = [line.strip() for line in result.stdout.strip().split("\n") if line.strip()]
-            # Collect GPUs in categories matching Vulkan enumeration order:
-            # Vulkan typically enumerates: discrete NVIDIA, discrete AMD, then integrated
-            nvidia_discrete = []
-            amd_discrete = []
-            integrated = []
-            for line in lines[1:]:  # Skip header "Name"
-                if line and line != "Name":
-                    lower = line.lower()
-                    # Skip known virtual display adapters
-                    if "parsec" in lower or "virtual" in lower or "microsoft" in lower:
-                        continue
-                    # Categorize to match Vulkan enumeration order
-                    if "radeon graphics" in lower or "uhd graphics" in lower or "iris" in lower:
-                        integrated.append(line)
-                    elif "nvidia" in lower or "geforce" in lower or "rtx" in lower or "gtx" in lower:
-                        nvidia_discrete.append(line)
-                    elif "radeon" in lower or "amd" in lower:
-                        amd_discrete.append(line)
-                    else:
-                        # Unknown - treat as discrete
-                        nvidia_discrete.append(line)
-            # Build device list matching Vulkan order: NVIDIA first, then AMD discrete, then integrated
-            for name in nvidia_discrete + amd_discrete + integrated:
-                devices.append(GPUDeviceInfo(index=len(devices), name=name))
-    except FileNotFoundError:
-        pass
-    except subprocess.TimeoutExpired:
-        logger.debug("wmic timed out during GPU enumeration")
+        # Pre-built binaries ship ggml-vulkan.dll in site-packages
+        vulkan_dll = _vulkan_dll_path() is not None
+    except Exception:
+        vulkan_dll = False
+
+    try:
+        info = _system_info()
     except Exception as e:
-        logger.debug("GPU enumeration failed: %s", e)
-    return devices
+        return _BackendProbe(
+            has_cuda=False,
+            has_vulkan=vulkan_dll,
+            system_info=f"Error getting backend info: {e}",
+            vulkan_dll=vulkan_dll,
+        )
+
+    # System info lists "CUDA" / "Vulkan" if built with that backend
+    tokens = _system_info_tokens(info)
+    return _BackendProbe(
+        has_cuda="CUDA" in tokens,
+        has_vulkan="VULKAN" in tokens or vulkan_dll,
+        system_info=info,
+        vulkan_dll=vulkan_dll,
+        tokens=tokens,
+    )
 
 
 def _check_pywhispercpp_cuda() -> bool:
@@ -214,14 +684,7 @@ def _check_pywhispercpp_cuda() -> bool:
     CUDA builds include ggml-cuda backend which is used automatically.
     Detection via whisper_print_system_info() which shows "CUDA" if available.
     """
-    try:
-        import _pywhispercpp as pw
-        info = pw.whisper_print_system_info()
-        # System info contains "CUDA" if built with CUDA support
-        return "CUDA" in info
-    except Exception:
-        pass
-    return False
+    return _backend_probe().has_cuda
 
 
 def _check_pywhispercpp_vulkan() -> bool:
@@ -231,21 +694,7 @@ def _check_pywhispercpp_vulkan() -> bool:
     Works with NVIDIA, AMD, and Intel GPUs (both discrete and integrated).
     Detection via whisper_print_system_info() or presence of ggml-vulkan.dll.
     """
-    try:
-        import _pywhispercpp as pw
-        info = pw.whisper_print_system_info()
-        if "Vulkan" in info:
-            return True
-        # Also check for ggml-vulkan.dll in site-packages (pre-built binaries)
-        import importlib.util
-        from pathlib import Path
-        spec = importlib.util.find_spec("_pywhispercpp")
-        if spec and spec.origin:
-            vulkan_dll = Path(spec.origin).parent / "ggml-vulkan.dll"
-            return vulkan_dll.exists()
-    except Exception:
-        pass
-    return False
+    return _backend_probe().has_vulkan
 
 
 def get_gpu_backend_info() -> str:
@@ -254,72 +703,264 @@ def get_gpu_backend_info() -> str:
     Returns:
         Backend information string from whisper_print_system_info().
     """
+    return _backend_probe().system_info
+
+
+def _hardware_fingerprint() -> str:
+    """Identify the machine and the pywhispercpp build a cached result is for.
+
+    The pywhispercpp extension's path and mtime change when it is reinstalled
+    or upgraded, which can change the available GPU backends.
+    """
+    import platform
+
+    from cld import __version__
+
+    parts = [__version__, platform.node(), platform.machine(), str(_effective_cpu_count())]
+    origin = _pywhispercpp_origin()
+    if origin is not None:
+        try:
+            parts += [str(origin), str(origin.stat().st_mtime_ns)]
+        except OSError:
+            pass
+    return "|".join(parts)
+
+
+def _hardware_cache_path() -> Path:
+    from cld.config import Config
+
+    return Config.get_config_dir() / _HARDWARE_CACHE_FILE
+
+
+def _load_cached_hardware(fingerprint: str) -> Optional[HardwareInfo]:
+    """Return the persisted HardwareInfo if it was saved for this fingerprint."""
     try:
-        import _pywhispercpp as pw
-        return pw.whisper_print_system_info()
+        data = json.loads(_hardware_cache_path().read_text(encoding="utf-8"))
+        if (
+            data.get("version") != _HARDWARE_CACHE_VERSION
+            or data.get("fingerprint") != fingerprint
+        ):
+            return None
+        return HardwareInfo(**data["info"])
+    except FileNotFoundError:
+        return None
     except Exception as e:
-        return f"Error getting backend info: {e}"
+        logger.debug("Ignoring hardware cache: %s", e)
+        return None
+
+
+def _save_cached_hardware(fingerprint: str, info: HardwareInfo) -> None:
+    """Persist a HardwareInfo atomically (temp file + os.replace)."""
+    from dataclasses import asdict
+
+    try:
+        cache_path = _hardware_cache_path()
+        tmp_path = cache_path.with_suffix(".tmp")
+        data = {
+            "version": _HARDWARE_CACHE_VERSION,
+            "fingerprint": fingerprint,
+            "info": asdict(info),
+        }
+        tmp_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        logger.debug("Failed to save hardware cache: %s", e)
+
+
+def start_background_detect() -> None:
+    """Start detect_hardware() on a background thread.
+
+    Call at app startup so the probes (a first launch, or after the cache
+    was invalidated) are done before a dialog needs the result. Repeated
+    calls are no-ops.
+    """
+    global _detect_future
+    from concurrent.futures import ThreadPoolExecutor
+
+    with _detect_lock:
+        if _detect_future is not None:
+            return
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cld-hw-detect")
+        _detect_future = executor.submit(_detect_hardware)
+        executor.shutdown(wait=False)
 
 
 def detect_hardware() -> HardwareInfo:
     """Detect hardware capabilities and recommend STT configuration.
 
+    Hardware does not change while the process runs, so detection happens
+    once and later calls return the same (frozen) HardwareInfo; if
+    start_background_detect() was called, this waits for that run instead
+    of probing again. The result is also persisted and reused by later
+    launches on the same machine and pywhispercpp build; set
+    CLD_REFRESH_HW=1 (or pass --refresh-hardware) to probe again, e.g.
+    after changing GPUs.
+
     Returns:
         HardwareInfo with detection results and recommendations.
     """
-    info = HardwareInfo()
+    future = _detect_future
+    if future is not None:
+        return future.result()
+    return _detect_hardware()
 
-    # Detect CPU cores
+
+def invalidate_hardware_cache() -> None:
+    """Forget the detection result so the next detect_hardware() probes again.
+
+    Clears the in-process memo and deletes the persisted cache, e.g. after
+    the user changed GPUs. The pywhispercpp backend probe is kept: the
+    loaded extension cannot change while the process runs.
+    """
+    global _detect_future
+
+    with _detect_lock:
+        _detect_future = None
+        _detect_hardware.cache_clear()
+        _list_gpu_adapters.cache_clear()
+        _physical_gpu_adapters.cache_clear()
+        _enumerate_gpus.cache_clear()
     try:
-        import os
-        info.cpu_cores = os.cpu_count() or 1
-    except Exception:
+        _hardware_cache_path().unlink(missing_ok=True)
+    except Exception as e:
+        logger.debug("Failed to remove hardware cache: %s", e)
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_hardware() -> HardwareInfo:
+    fingerprint = _hardware_fingerprint()
+    if os.environ.get("CLD_REFRESH_HW") != "1":
+        cached = _load_cached_hardware(fingerprint)
+        if cached is not None:
+            logger.debug("Using cached hardware detection: %s", cached.summary)
+            return cached
+
+    info = _probe_hardware()
+    _save_cached_hardware(fingerprint, info)
+    return info
+
+
+@functools.lru_cache(maxsize=1)
+def _effective_cpu_count() -> int:
+    """Return the number of CPUs this process may run on.
+
+    Honors CPU affinity (taskset, cgroup cpusets) where the OS exposes it,
+    unlike os.cpu_count(), so a restricted process is not recommended a
+    model sized for the whole machine.
+    """
+    try:
+        return len(os.sched_getaffinity(0)) or 1
+    except (AttributeError, OSError):
         pass
+    # Python 3.13+: affinity-aware on Windows as well
+    process_cpu_count = getattr(os, "process_cpu_count", None)
+    if process_cpu_count is not None:
+        return process_cpu_count() or 1
+    return os.cpu_count() or 1
+
+
+@functools.lru_cache(maxsize=1)
+def _total_ram_gb() -> Optional[float]:
+    """Return total physical RAM in GiB using the platform's native API.
+
+    psutil (a heavy import for one number) is only used on platforms
+    without a native path here. Installed RAM does not change while the
+    process runs, so the structure and DLL lookups happen once.
+    """
+    import ctypes
+
+    if _IS_WINDOWS:
+        c_ulonglong = ctypes.c_ulonglong
+
+        class MEMORYSTATUSEX(ctypes.Structure):
+            _fields_ = [
+                ("dwLength", ctypes.c_ulong),
+                ("dwMemoryLoad", ctypes.c_ulong),
+                ("ullTotalPhys", c_ulonglong),
+                ("ullAvailPhys", c_ulonglong),
+                ("ullTotalPageFile", c_ulonglong),
+                ("ullAvailPageFile", c_ulonglong),
+                ("ullTotalVirtual", c_ulonglong),
+                ("ullAvailVirtual", c_ulonglong),
+                ("ullAvailExtendedVirtual", c_ulonglong),
+            ]
+
+        stat = MEMORYSTATUSEX()
+        stat.dwLength = ctypes.sizeof(stat)
+        if not ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(stat)):
+            return None
+        return stat.ullTotalPhys / (1024**3)
+
+    if sys.platform.startswith("linux"):
+        with open("/proc/meminfo", encoding="ascii") as meminfo:
+            for line in meminfo:
+                if line.startswith("MemTotal:"):
+                    # "MemTotal:       16318480 kB"
+                    return int(line.split()[1]) * 1024 / (1024**3)
+        return None
+
+    if sys.platform == "darwin":
+        libc = ctypes.CDLL(None)
+        memsize = ctypes.c_uint64()
+        size = ctypes.c_size_t(ctypes.sizeof(memsize))
+        if libc.sysctlbyname(b"hw.memsize", ctypes.byref(memsize), ctypes.byref(size), None, 0):
+            return None
+        return memsize.value / (1024**3)
 
-    # Detect system RAM
     try:
         import psutil
-        mem = psutil.virtual_memory()
-        info.ram_gb = mem.total / (1024**3)
     except ImportError:
-        # Fallback for Windows without psutil
-        try:
-            import ctypes
-            kernel32 = ctypes.windll.kernel32
-            c_ulonglong = ctypes.c_ulonglong
-
-            class MEMORYSTATUSEX(ctypes.Structure):
-                _fields_ = [
-                    ("dwLength", ctypes.c_ulong),
-                    ("dwMemoryLoad", ctypes.c_ulong),
-                    ("ullTotalPhys", c_ulonglong),
-                    ("ullAvailPhys", c_ulonglong),
-                    ("ullTotalPageFile", c_ulonglong),
-                    ("ullAvailPageFile", c_ulonglong),
-                    ("ullTotalVirtual", c_ulonglong),
-                    ("ullAvailVirtual", c_ulonglong),
-                    ("ullAvailExtendedVirtual", c_ulonglong),
-                ]
-
-            stat = MEMORYSTATUSEX()
-            stat.dwLength = ctypes.sizeof(stat)
-            kernel32.GlobalMemoryStatusEx(ctypes.byref(stat))
-            info.ram_gb = stat.ullTotalPhys / (1024**3)
-        except Exception:
-            pass
+        return None
+    return psutil.virtual_memory().total / (1024**3)
+
+
+def _probe_cpu_and_ram() -> tuple[int, Optional[float]]:
+    """Return (CPU cores, total RAM in GiB), with defaults on failure."""
+    cpu_cores = 1
+    ram_gb = None
+
+    # Detect CPU cores
+    try:
+        cpu_cores = _effective_cpu_count()
     except Exception:
         pass
 
-    # Detect GPU via WMI (works with NVIDIA, AMD, Intel)
-    has_gpu, gpu_name = _detect_gpu_wmi()
-    if has_gpu:
-        info.gpu_name = gpu_name
+    # Detect system RAM
+    try:
+        ram_gb = _total_ram_gb()
+    except Exception as e:
+        logger.debug("RAM detection failed: %s", e)
+
+    return cpu_cores, ram_gb
+
+
+def _probe_hardware() -> HardwareInfo:
+    """Run the hardware probes (CPU, RAM, GPU, pywhispercpp backends).
+
+    The display adapter query (possibly a PowerShell subprocess) and the
+    pywhispercpp backend probe (extension import and system info) are
+    independent and dominate the cost, so the adapter query runs on a
+    worker thread while the rest is probed here.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="cld-hw-gpu") as executor:
+        # Detect GPU from the display adapters (works with NVIDIA, AMD, Intel)
+        gpu_future = executor.submit(_detect_gpu)
+        _backend_probe()
+        cpu_cores, ram_gb = _probe_cpu_and_ram()
+        has_gpu, gpu_name = gpu_future.result()
 
     # Check GPU backends in pywhispercpp
     # Vulkan is preferred (universal support: NVIDIA, AMD, Intel discrete and integrated)
     # CUDA is fallback (NVIDIA-only, specific architecture builds)
-    info.has_vulkan = _check_pywhispercpp_vulkan()
-    info.has_cuda = _check_pywhispercpp_cuda()
+    info = HardwareInfo(
+        has_cuda=_check_pywhispercpp_cuda(),
+        has_vulkan=_check_pywhispercpp_vulkan(),
+        gpu_name=gpu_name if has_gpu else None,
+        cpu_cores=cpu_cores,
+        ram_gb=ram_gb,
+    )
 
     if info.has_vulkan:
         logger.info("Vulkan GPU backend available (universal GPU support)")
@@ -330,9 +971,8 @@ def detect_hardware() -> HardwareInfo:
                    "Rebuild with GGML_VULKAN=1 for universal GPU acceleration.")
 
     # Determine recommendations based on hardware
-    info.recommended_engine, info.recommended_model = _get_recommendations(info)
-
-    return info
+    engine, model = _get_recommendations(info)
+    return replace(info, recommended_engine=engine, recommended_model=model)
 
 
 def _get_recommendations(info: HardwareInfo) -> tuple[str, str]:
@@ -352,17 +992,10 @@ def _get_recommendations(info: HardwareInfo) -> tuple[str, str]:
     """
     # GPU available - recommend medium-q5_0 as good balance
     if info.has_gpu:
-        return ("whisper", "medium-q5_0")
+        return _GPU_RECOMMENDATION
 
     # CPU-only recommendations based on core count
-    if info.cpu_cores < 2:
-        return ("whisper", "small")
-    elif info.cpu_cores >= 8:
-        return ("whisper", "medium")
-    elif info.cpu_cores >= 4:
-        return ("whisper", "medium-q5_0")
-    else:
-        return ("whisper", "small")
+    return _CPU_RECOMMENDATIONS[max(0, min(info.cpu_cores, len(_CPU_RECOMMENDATIONS) - 1))]
 
 
 def get_max_supported_model(info: Optional[HardwareInfo] = None) -> str: